@@ -1,5 +1,7 @@
 import os
 from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -10,8 +12,62 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    token_cache_size: int = 4096
+    login_rate_limit_enabled: bool = True
+    login_ip_burst: int = 20
+    login_ip_per_minute: float = 10.0
+    login_email_burst: int = 5
+    login_email_per_minute: float = 2.0
     database_url: str = "sqlite:///./data/mercury.db"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_read_pool_size: int = 20
+    db_read_max_overflow: int = 40
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_cache_size: int = -32000
+    sqlite_mmap_size: int = 268435456
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    sqlite_busy_timeout: int = 5000
+    sqlite_wal_autocheckpoint: int = 1000
+    write_queue_enabled: bool = True
+    write_queue_group_size: int = 32
+    sql_instrumentation_enabled: bool = True
+    sql_repeat_warn_threshold: int = 10
+    slow_query_log_enabled: bool = False
+    slow_query_threshold_ms: float = 100.0
+    slow_query_log_size: int = 200
+    audit_async_enabled: bool = True
+    audit_sync_actions: list[str] = ["wallet_adjusted", "dispute_resolved"]
+    audit_queue_size: int = 10000
+    audit_batch_size: int = 500
+    audit_flush_interval: float = 1.0
+    audit_spool_path: str = "./data/audit_spool.jsonl"
+    audit_retention_days: int = 365
+    audit_archive_chunk_size: int = 5000
+    audit_retention_interval: float = 6 * 3600
     frontend_build_dir: str = "./frontend/dist"
+    threadpool_size: int = 40
+    leader_lock_path: str = "./data/scheduler.lock"
+    cache_bus_poll_interval: float = 0.5
+    cache_invalidation_retention: int = 3600
+    product_cache_size: int = 2048
+    product_cache_ttl: float = 300.0
+    job_worker_concurrency: int = 2
+    job_poll_interval: float = 1.0
+    job_visibility_timeout: float = 60.0
+    job_max_attempts: int = 5
+    job_retry_backoff: float = 5.0
+    payout_processing_delay: float = 3.0
+    payout_settlement_mode: Literal["individual", "batch"] = "individual"
+    payout_settlement_interval: float = 3600.0
+    payout_settlement_batch_size: int = 1000
+    settlement_dir: str = "./data/settlements"
+    counter_recount_interval: float = 3600.0
+    bulk_action_max_ids: int = 10000
+    bulk_action_chunk_size: int = 500
+    export_batch_size: int = 2000
+    drive_max_upload_size: int = 50 * 1024 * 1024
 
     class Config:
         env_file = ".env"
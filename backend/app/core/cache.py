@@ -0,0 +1,199 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Hashable, Optional
+
+from sqlalchemy import delete, event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, read_engine
+from app.models.cache import CacheInvalidation
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+_PENDING_KEY = "cache_pending_evictions"
+
+
+class LocalCache:
+    """Per-process LRU cache with a TTL, registered under a namespace.
+
+    Writers call :func:`invalidate` with the namespace and key they changed;
+    every worker's :class:`InvalidationBus` then evicts the key locally, so
+    cached values stay coherent across processes.
+
+    A reader that loaded a value before an eviction must not store it after
+    one. Take :meth:`generation` before reading the source and pass it to
+    :meth:`set`, which skips values older than the key's last eviction.
+    """
+
+    # Evictions remembered per key; older ones fold into a single floor
+    _EVICTION_HISTORY = 1024
+
+    def __init__(self, namespace: str, maxsize: int, ttl: float):
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._evicted: OrderedDict[str, int] = OrderedDict()
+        self._evicted_floor = 0
+        _caches[namespace] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        key = str(key)
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        key = str(key)
+        with self._lock:
+            if generation is not None and max(self._evicted_floor, self._evicted.get(key, 0)) > generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+                self._evicted.clear()
+                self._evicted_floor = self._generation
+                return
+            key = str(key)
+            self._entries.pop(key, None)
+            self._evicted[key] = self._generation
+            self._evicted.move_to_end(key)
+            while len(self._evicted) > self._EVICTION_HISTORY:
+                _, dropped = self._evicted.popitem(last=False)
+                self._evicted_floor = max(self._evicted_floor, dropped)
+
+
+_caches: dict[str, LocalCache] = {}
+_listeners: dict[str, list[Callable[[Optional[str]], None]]] = {}
+
+
+def on_invalidate(namespace: str, callback: Callable[[Optional[str]], None]) -> None:
+    """Call ``callback(key)`` whenever ``namespace`` is invalidated in any worker.
+
+    Callbacks run on the bus poller's thread, so they must be thread-safe.
+    """
+    _listeners.setdefault(namespace, []).append(callback)
+
+
+def _evict_local(namespace: str, key: Optional[str]) -> None:
+    cache = _caches.get(namespace)
+    if cache is not None:
+        cache.evict(key)
+    for callback in _listeners.get(namespace, ()):
+        try:
+            callback(key)
+        except Exception:
+            logger.exception(f"Invalidation listener for {namespace!r} failed")
+
+
+def invalidate(db: Session, namespace: str, key: Optional[Hashable] = None) -> None:
+    """Evict ``key`` (or the whole namespace) from every worker's cache.
+
+    The invalidation is recorded in the caller's transaction, so other workers
+    only see it once the change it describes has committed. This worker evicts
+    right after the commit too; evicting earlier would let a concurrent read
+    cache the pre-commit value again.
+    """
+    str_key = None if key is None else str(key)
+    db.add(CacheInvalidation(namespace=namespace, key=str_key))
+    db.info.setdefault(_PENDING_KEY, []).append((namespace, str_key))
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _evict_committed(session: Session) -> None:
+    for namespace, key in session.info.pop(_PENDING_KEY, ()):
+        _evict_local(namespace, key)
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _discard_rolled_back(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+class InvalidationBus:
+    """Tails ``cache_invalidations`` and evicts the named keys in this process.
+
+    ``PRAGMA data_version`` on a dedicated connection changes only when another
+    connection commits, so an idle poll is a single pragma and the table is
+    read only after something was written.
+    """
+
+    def __init__(self):
+        self._conn = None
+        self._data_version: Optional[int] = None
+        self._last_id = 0
+
+    def start(self) -> None:
+        self._conn = read_engine.raw_connection()
+        cursor = self._conn.cursor()
+        try:
+            self._data_version = cursor.execute("PRAGMA data_version").fetchone()[0]
+            self._last_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM cache_invalidations").fetchone()[0]
+        finally:
+            cursor.close()
+
+    def stop(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def poll(self) -> int:
+        if self._conn is None:
+            return 0
+        cursor = self._conn.cursor()
+        try:
+            data_version = cursor.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == self._data_version:
+                return 0
+            self._data_version = data_version
+
+            rows = cursor.execute(
+                "SELECT id, namespace, key FROM cache_invalidations WHERE id > ? ORDER BY id",
+                (self._last_id,),
+            ).fetchall()
+        finally:
+            cursor.close()
+
+        for row_id, namespace, key in rows:
+            _evict_local(namespace, key)
+            self._last_id = row_id
+        return len(rows)
+
+
+bus = InvalidationBus()
+
+
+def prune_invalidations() -> int:
+    """Drop bus entries old enough that every live worker has consumed them."""
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.cache_invalidation_retention)
+    with SessionLocal() as db:
+        result = db.execute(delete(CacheInvalidation).where(CacheInvalidation.created_at < cutoff))
+        db.commit()
+        return result.rowcount
@@ -2,24 +2,22 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.core.security import decode_token
 from app.models.user import User, UserRole
 
 security = HTTPBearer()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+def authenticate_token(token: str, db: Session) -> User:
+    """Resolve an access token to an active user, raising 401/403 otherwise."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_token(credentials.credentials)
+    payload = decode_token(token)
     if payload is None or payload.get("type") != "access":
         raise credentials_exception
 
@@ -40,19 +38,50 @@ def get_current_user(
     return user
 
 
-def get_current_seller(current_user: User = Depends(get_current_user)) -> User:
-    if current_user.role not in (UserRole.seller, UserRole.admin):
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> User:
+    return authenticate_token(credentials.credentials, db)
+
+
+def get_current_user_read(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_read_db),
+) -> User:
+    """``get_current_user`` for read-only routes: loads the principal on the read pool."""
+    return authenticate_token(credentials.credentials, db)
+
+
+def require_seller(user: User) -> User:
+    if user.role not in (UserRole.seller, UserRole.admin):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="A seller account is required for this action",
         )
-    return current_user
+    return user
 
 
-def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
-    if current_user.role != UserRole.admin:
+def require_admin(user: User) -> User:
+    if user.role != UserRole.admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Administrator access required",
         )
-    return current_user
+    return user
+
+
+def get_current_seller(current_user: User = Depends(get_current_user)) -> User:
+    return require_seller(current_user)
+
+
+def get_current_seller_read(current_user: User = Depends(get_current_user_read)) -> User:
+    return require_seller(current_user)
+
+
+def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+    return require_admin(current_user)
+
+
+def get_current_admin_read(current_user: User = Depends(get_current_user_read)) -> User:
+    return require_admin(current_user)
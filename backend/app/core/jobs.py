@@ -0,0 +1,219 @@
+import importlib
+import json
+import logging
+import os
+import socket
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import ReadSessionLocal, SessionLocal
+from app.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Handler:
+    run: Callable[[dict], None]
+    give_up: Optional[Callable[[dict, str], None]] = None
+
+
+_handlers: dict[str, _Handler] = {}
+
+# Modules that register handlers when imported. Every process running a
+# JobWorker loads all of them, so no job kind is left without a handler.
+HANDLER_MODULES = (
+    "app.services.payout_service",
+    "app.services.settlement_service",
+)
+
+
+def load_handlers() -> None:
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+
+
+def register_handler(
+    kind: str,
+    run: Callable[[dict], None],
+    give_up: Optional[Callable[[dict, str], None]] = None,
+) -> None:
+    """Route jobs of ``kind`` to ``run(payload)``.
+
+    ``run`` must be idempotent: a job whose worker dies is claimed again once
+    its visibility timeout lapses. ``give_up(payload, error)`` is called once a
+    job has failed ``max_attempts`` times.
+    """
+    _handlers[kind] = _Handler(run, give_up)
+
+
+def enqueue(
+    db: Session,
+    kind: str,
+    payload: dict[str, Any],
+    *,
+    ref: Optional[str] = None,
+    delay: float = 0,
+    max_attempts: Optional[int] = None,
+) -> Job:
+    """Add a job in the caller's transaction, so it exists only if that work commits."""
+    job = Job(
+        kind=kind,
+        ref=ref,
+        payload=json.dumps(payload),
+        status=JobStatus.queued,
+        max_attempts=max_attempts or settings.job_max_attempts,
+        run_at=datetime.utcnow() + timedelta(seconds=delay),
+    )
+    db.add(job)
+    return job
+
+
+def _due(now: datetime):
+    return or_(
+        and_(Job.status == JobStatus.queued, Job.run_at <= now),
+        and_(Job.status == JobStatus.running, Job.locked_until < now),
+    )
+
+
+def _claim(worker_id: str) -> Optional[tuple[int, str, str, int, int]]:
+    """Lease the next due job, or one whose lease expired, in a single UPDATE.
+
+    A write statement takes SQLite's write lock before it reads, so two
+    workers (or two processes) can never lease the same job. Idle polls stop
+    at a SELECT on a read connection and never contend for that lock.
+    """
+    now = datetime.utcnow()
+    with ReadSessionLocal() as db:
+        if db.execute(select(Job.id).where(_due(now)).limit(1)).first() is None:
+            return None
+
+    due = (
+        select(Job.id)
+        .where(_due(now))
+        .order_by(Job.run_at, Job.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(Job)
+        .where(Job.id == due)
+        .values(
+            status=JobStatus.running,
+            attempts=Job.attempts + 1,
+            locked_by=worker_id,
+            locked_until=now + timedelta(seconds=settings.job_visibility_timeout),
+        )
+        .returning(Job.id, Job.kind, Job.payload, Job.attempts, Job.max_attempts)
+    )
+    with SessionLocal() as db:
+        try:
+            row = db.execute(stmt).first()
+            db.commit()
+        except OperationalError as e:
+            db.rollback()
+            logger.warning(f"Job claim by {worker_id} failed: {e}")
+            return None
+    return tuple(row) if row else None
+
+
+def _settle(job_id: int, worker_id: str, attempts: int, **values) -> bool:
+    # Matching the lease guards against a worker whose lease already expired
+    # and was handed to someone else.
+    with SessionLocal() as db:
+        result = db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker_id, Job.attempts == attempts)
+            .values(locked_by=None, locked_until=None, **values)
+        )
+        db.commit()
+        return result.rowcount == 1
+
+
+def run_next(worker_id: str) -> bool:
+    """Run one due job. Returns False when the queue had nothing to do."""
+    claimed = _claim(worker_id)
+    if claimed is None:
+        return False
+
+    job_id, kind, raw_payload, attempts, max_attempts = claimed
+    payload = json.loads(raw_payload)
+    handler = _handlers.get(kind)
+    if handler is None:
+        # Retrying cannot help; fail now rather than after max_attempts backoffs
+        error = f"No handler registered for job kind {kind!r}"
+        logger.error(f"Job #{job_id} ({kind}) failed permanently: {error}")
+        _settle(job_id, worker_id, attempts, status=JobStatus.failed, last_error=error,
+                finished_at=datetime.utcnow())
+        return True
+
+    try:
+        handler.run(payload)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        if attempts >= max_attempts:
+            logger.error(f"Job #{job_id} ({kind}) failed permanently after {attempts} attempts: {error}")
+            if _settle(job_id, worker_id, attempts, status=JobStatus.failed, last_error=error,
+                       finished_at=datetime.utcnow()) and handler.give_up:
+                handler.give_up(payload, error)
+        else:
+            delay = settings.job_retry_backoff * 2 ** (attempts - 1)
+            logger.warning(f"Job #{job_id} ({kind}) attempt {attempts} failed, retrying in {delay:.0f}s: {error}")
+            _settle(job_id, worker_id, attempts, status=JobStatus.queued, last_error=error,
+                    run_at=datetime.utcnow() + timedelta(seconds=delay))
+        return True
+
+    _settle(job_id, worker_id, attempts, status=JobStatus.done, finished_at=datetime.utcnow())
+    return True
+
+
+class JobWorker:
+    """Pool of threads draining the ``jobs`` table.
+
+    Runs inside each web worker (``JOB_WORKER_CONCURRENCY`` threads, 0 to
+    disable) or on its own via ``python worker.py``, so job throughput can be
+    scaled separately from HTTP traffic.
+    """
+
+    def __init__(self, concurrency: int, poll_interval: float):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        load_handlers()
+        self._stop.clear()
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        for n in range(self.concurrency):
+            thread = threading.Thread(
+                target=self._run, args=(f"{prefix}:{n}",), name=f"job-worker-{n}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _run(self, worker_id: str) -> None:
+        while not self._stop.is_set():
+            try:
+                busy = run_next(worker_id)
+            except Exception as e:
+                logger.error(f"Job worker {worker_id} error: {e}")
+                busy = False
+            if not busy:
+                self._stop.wait(self.poll_interval)
+
+
+worker = JobWorker(settings.job_worker_concurrency, settings.job_poll_interval)
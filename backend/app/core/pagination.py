@@ -0,0 +1,59 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_page(
+    query: Query,
+    created_col,
+    id_col,
+    cursor: Optional[str],
+    limit: int,
+    key: Optional[Callable[[Any], tuple[datetime, int]]] = None,
+    oldest_first: bool = False,
+) -> tuple[list, Optional[str]]:
+    """Newest-first page of ``query`` after ``cursor``, plus the cursor for the next page.
+
+    Seeks on ``(created_col, id_col)`` instead of using OFFSET, so each page is
+    an index range scan no matter how deep it is. ``oldest_first`` walks the
+    same index in chronological order instead.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        position = tuple_(created_col, id_col)
+        if oldest_first:
+            query = query.filter(position > tuple_(created_at, row_id))
+        else:
+            query = query.filter(position < tuple_(created_at, row_id))
+
+    if oldest_first:
+        query = query.order_by(created_col.asc(), id_col.asc())
+    else:
+        query = query.order_by(created_col.desc(), id_col.desc())
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(*(key(last) if key else (last.created_at, last.id)))
+    return rows, next_cursor
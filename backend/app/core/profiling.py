@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RequestQueryStats:
+    """Queries executed and time spent in the database for one request."""
+
+    __slots__ = ("path", "count", "duration", "shapes")
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        # Statements reach the cursor already parameterised, so the SQL text
+        # is the statement shape.
+        self.shapes[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(shape, n) for shape, n in self.shapes.items() if n > threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries"'
+
+
+_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def begin_request(path: Optional[str] = None):
+    """Start collecting query stats for the current request context."""
+    stats = RequestQueryStats(path)
+    return stats, _request_stats.set(stats)
+
+
+def end_request(token) -> None:
+    _request_stats.reset(token)
+
+
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+
+_slow_queries: deque[dict] = deque(maxlen=settings.slow_query_log_size)
+_slow_queries_lock = threading.Lock()
+
+
+def _parameter_shape(parameters: Any) -> Any:
+    # Record types only: bound values can carry emails, tokens and hashes.
+    if isinstance(parameters, dict):
+        return {k: type(v).__name__ for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(v).__name__ for v in parameters]
+    return type(parameters).__name__
+
+
+def _explain(cursor, statement: str, parameters: Any) -> list[str]:
+    try:
+        plan_cursor = cursor.connection.cursor()
+        try:
+            plan_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return [row[-1] for row in plan_cursor.fetchall()]
+        finally:
+            plan_cursor.close()
+    except Exception as e:
+        return [f"<explain failed: {e}>"]
+
+
+def _record_slow_query(cursor, statement: str, parameters: Any, elapsed: float, executemany: bool) -> None:
+    stats = _request_stats.get()
+    plan: list[str] = []
+    if not executemany and statement.lstrip().upper().startswith(_EXPLAINABLE):
+        plan = _explain(cursor, statement, parameters)
+
+    entry = {
+        "recorded_at": datetime.utcnow(),
+        "duration_ms": round(elapsed * 1000, 2),
+        "path": stats.path if stats is not None else None,
+        "statement": statement,
+        "parameters": _parameter_shape(parameters),
+        "executemany": executemany,
+        "query_plan": plan,
+    }
+    with _slow_queries_lock:
+        _slow_queries.append(entry)
+    logger.warning(f"Slow query ({entry['duration_ms']} ms): {' '.join(statement.split())[:200]} | plan={plan}")
+
+
+def get_slow_queries() -> list[dict]:
+    """Recorded slow queries, newest first."""
+    with _slow_queries_lock:
+        return list(reversed(_slow_queries))
+
+
+def clear_slow_queries() -> None:
+    with _slow_queries_lock:
+        _slow_queries.clear()
+
+
+def instrument_engine(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+
+        if settings.slow_query_log_enabled and elapsed * 1000 >= settings.slow_query_threshold_ms:
+            _record_slow_query(cursor, statement, parameters, elapsed, executemany)
+
+
+def report_request(method: str, path: str, stats: RequestQueryStats) -> None:
+    for shape, n in stats.repeated(settings.sql_repeat_warn_threshold):
+        logger.warning(
+            f"Possible N+1: {method} {path} ran the same statement {n} times "
+            f"({stats.count} queries total): {' '.join(shape.split())[:200]}"
+        )
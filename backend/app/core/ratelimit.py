@@ -0,0 +1,57 @@
+import math
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucketLimiter:
+    """In-process token buckets keyed by an arbitrary string.
+
+    Each key holds ``(tokens, last_refill)``; a check refills the bucket by the
+    elapsed time and spends one token, so ``hit`` is O(1). Buckets that have
+    been idle long enough to be full again carry no state worth keeping and are
+    swept out every ``sweep_interval`` seconds. A bucket that never refills
+    would never become sweepable, so the rate must be positive.
+    """
+
+    def __init__(self, burst: int, per_minute: float, sweep_interval: float = 60.0):
+        if per_minute <= 0:
+            raise ValueError(f"per_minute must be positive, got {per_minute}")
+        self.burst = float(burst)
+        self.rate = per_minute / 60.0
+        self.sweep_interval = sweep_interval
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + sweep_interval
+
+    def hit(self, key: str) -> Optional[int]:
+        """Spend a token for ``key``. Returns ``None`` if allowed, else the
+        number of seconds to wait before retrying."""
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                self._buckets[key] = [self.burst - 1, now]
+                return None
+
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return None
+
+            bucket[0] = tokens
+            return max(1, math.ceil((1 - tokens) / self.rate))
+
+    def _sweep(self, now: float) -> None:
+        idle = self.burst / self.rate
+        stale = [k for k, (_, ts) in self._buckets.items() if now - ts >= idle]
+        for k in stale:
+            del self._buckets[k]
+        self._next_sweep = now + self.sweep_interval
+
+    def __len__(self) -> int:
+        return len(self._buckets)
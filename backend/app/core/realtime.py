@@ -0,0 +1,57 @@
+import asyncio
+import threading
+from typing import Optional
+
+from app.core import cache
+
+DISPUTE_NAMESPACE = "dispute"
+
+
+class DisputeHub:
+    """Wakes this process's dispute sockets when a thread changes.
+
+    Each socket subscribes an :class:`asyncio.Event` for its dispute and, when
+    woken, reads only the messages newer than the last one it sent. ``notify``
+    may be called from any thread; changes made by other workers arrive through
+    the cache invalidation bus.
+    """
+
+    def __init__(self):
+        self._rooms: dict[int, set[asyncio.Event]] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def subscribe(self, dispute_id: int) -> asyncio.Event:
+        event = asyncio.Event()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._rooms.setdefault(dispute_id, set()).add(event)
+        return event
+
+    def unsubscribe(self, dispute_id: int, event: asyncio.Event) -> None:
+        with self._lock:
+            room = self._rooms.get(dispute_id)
+            if room is not None:
+                room.discard(event)
+                if not room:
+                    del self._rooms[dispute_id]
+
+    def notify(self, dispute_id: int) -> None:
+        with self._lock:
+            events = list(self._rooms.get(dispute_id, ()))
+            loop = self._loop
+        if not events or loop is None or loop.is_closed():
+            return
+        for event in events:
+            loop.call_soon_threadsafe(event.set)
+
+
+hub = DisputeHub()
+
+
+def _on_dispute_invalidated(key: Optional[str]) -> None:
+    if key is not None:
+        hub.notify(int(key))
+
+
+cache.on_invalidate(DISPUTE_NAMESPACE, _on_dispute_invalidated)
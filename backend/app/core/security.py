@@ -1,4 +1,8 @@
+import hashlib
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -32,13 +36,66 @@ def create_refresh_token(data: dict) -> str:
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
+class _VerifiedTokenCache:
+    """Bounded LRU of verified token payloads, keyed by token digest.
+
+    Entries carry the token's ``exp`` and are dropped on lookup once it has
+    passed, so an expired token is never served from the cache.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: bytes, payload: dict) -> None:
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        with self._lock:
+            self._entries[key] = (float(exp), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_token_cache = _VerifiedTokenCache(settings.token_cache_size)
+
+
 def decode_token(token: str) -> Optional[dict]:
+    key = None
+    if _token_cache.maxsize > 0:
+        key = hashlib.sha256(token.encode()).digest()
+        cached = _token_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return payload
     except JWTError:
         return None
 
+    if key is not None:
+        _token_cache.put(key, payload)
+        return dict(payload)
+    return payload
+
 
 def generate_token(length: int = 32) -> str:
     return secrets.token_urlsafe(length)
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import os
+from typing import Callable
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows dev machines run a single worker
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLock:
+    """Elects one worker process to run scheduled jobs.
+
+    Each uvicorn worker tries a non-blocking ``flock`` on a shared lock file;
+    whoever holds it is the leader until its process exits, at which point the
+    kernel releases the lock and the next worker to try takes over.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            self._fd = -1
+            return True
+
+        lock_dir = os.path.dirname(self.path)
+        if lock_dir:
+            os.makedirs(lock_dir, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        logger.info(f"Worker {os.getpid()} is now the scheduler leader")
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        if self._fd >= 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        self._fd = None
+
+
+leader = LeaderLock(settings.leader_lock_path)
+
+
+async def run_periodically(name: str, interval: float, func: Callable, *args, leader_only: bool = False) -> None:
+    """Run a blocking job in the threadpool every ``interval`` seconds until cancelled.
+
+    ``leader_only`` jobs run in just one worker process at a time.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        if leader_only and not leader.acquire():
+            continue
+        try:
+            await run_in_threadpool(func, *args)
+        except Exception as e:
+            logger.error(f"Periodic job '{name}' failed: {e}")
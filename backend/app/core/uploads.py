@@ -0,0 +1,169 @@
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, Request
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+
+# Room for the multipart boundaries and part headers around the file itself
+_ENVELOPE_ALLOWANCE = 16 * 1024
+
+
+def _format_size(size: int) -> str:
+    for unit, scale in (("MB", 1024 * 1024), ("KB", 1024)):
+        if size >= scale:
+            return f"{round(size / scale, 1):g} {unit}"
+    return f"{size} bytes"
+
+
+def _too_large(max_size: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File exceeds the {_format_size(max_size)} limit")
+
+
+@dataclass
+class ReceivedFile:
+    file_name: str
+    content_type: Optional[str]
+    path: str
+    size: int
+    sha256: str
+
+
+class _FilePartReader:
+    """Multipart callbacks that pick out one file field and buffer its bytes.
+
+    The parser's callbacks are synchronous, so data is only collected here and
+    written out by ``receive_file`` between parser feeds.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self.headers: dict[bytes, bytes] = {}
+        self.header_field = b""
+        self.header_value = b""
+        self.in_file = False
+        self.file_name: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self.chunks: list[bytes] = []
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+
+    def on_part_begin(self) -> None:
+        self.headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self.header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self.header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self.headers[self.header_field.lower()] = self.header_value
+        self.header_field = b""
+        self.header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self.headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("latin-1")
+        # Only the first part for the field is taken; repeats are ignored
+        if name != self.field or b"filename" not in options or self.file_name is not None:
+            return
+        self.in_file = True
+        self.file_name = options[b"filename"].decode("utf-8", "replace")
+        content_type = self.headers.get(b"content-type")
+        self.content_type = content_type.decode("latin-1") if content_type else None
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self.in_file:
+            self.chunks.append(data[start:end])
+
+    def on_part_end(self) -> None:
+        self.in_file = False
+
+
+async def _discard(path: str) -> None:
+    if await aiofiles.os.path.exists(path):
+        await aiofiles.os.remove(path)
+
+
+async def receive_file(
+    request: Request,
+    field: str,
+    dest_dir: str,
+    max_size: int,
+    allowed_types: Optional[set[str]] = None,
+) -> ReceivedFile:
+    """Stream one file field of a multipart request straight to ``dest_dir``.
+
+    Request chunks are parsed as they arrive and appended to the destination
+    with async I/O. Size and SHA-256 are computed along the way, so the file
+    is never spooled to a temp file, copied or re-read. The upload is
+    rejected with 413 as soon as it is known to exceed ``max_size``.
+    """
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    boundary = options.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
+
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_size + _ENVELOPE_ALLOWANCE:
+        raise _too_large(max_size)
+
+    reader = _FilePartReader(field)
+    parser = MultipartParser(boundary, reader.callbacks())
+    partial = os.path.join(dest_dir, f"{uuid.uuid4().hex}.part")
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        async with aiofiles.open(partial, "wb") as out:
+            async for chunk in request.stream():
+                parser.write(chunk)
+                if reader.file_name is not None and allowed_types and reader.content_type not in allowed_types:
+                    raise HTTPException(
+                        status_code=400, detail=f"Only {', '.join(sorted(allowed_types))} files are allowed"
+                    )
+                for data in reader.chunks:
+                    size += len(data)
+                    if size > max_size:
+                        raise _too_large(max_size)
+                    digest.update(data)
+                    await out.write(data)
+                reader.chunks.clear()
+            parser.finalize()
+
+        if reader.file_name is None:
+            raise HTTPException(status_code=400, detail=f"Missing file field '{field}'")
+
+        # Renaming keeps half-written uploads under a .part name
+        ext = os.path.splitext(reader.file_name)[1]
+        path = partial[: -len(".part")] + ext
+        await aiofiles.os.rename(partial, path)
+    except MultipartParseError:
+        await _discard(partial)
+        raise HTTPException(status_code=400, detail="Malformed multipart upload")
+    except BaseException:
+        await _discard(partial)
+        raise
+
+    return ReceivedFile(
+        file_name=reader.file_name,
+        content_type=reader.content_type,
+        path=path,
+        size=size,
+        sha256=digest.hexdigest(),
+    )
@@ -0,0 +1,144 @@
+import contextvars
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, writer_engine
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_STOP = object()
+
+
+class WriteQueue:
+    """Runs write units of work one at a time on a dedicated writer thread.
+
+    SQLite has a single write lock; funnelling writes through one connection
+    turns lock contention (``SQLITE_BUSY`` and busy-wait stalls) into an
+    orderly queue. Units queued back to back are group-committed: up to
+    ``group_size`` of them run in one transaction. If one raises, the group is
+    rolled back, that unit's caller gets the exception and the others are
+    replayed without it, so every unit still commits or fails on its own.
+    """
+
+    def __init__(self, group_size: int):
+        self.group_size = max(1, group_size)
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, unit: Callable[[Session], T]) -> T:
+        self._ensure_started()
+        future: Future = Future()
+        self._jobs.put((unit, contextvars.copy_context(), future))
+        return future.result()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+                self._thread.start()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                return
+            self._jobs.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        db = _write_session()
+        while True:
+            job = self._jobs.get()
+            if job is _STOP:
+                break
+            group = [job]
+            while len(group) < self.group_size:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    self._jobs.put(_STOP)
+                    break
+                group.append(job)
+            try:
+                self._commit_group(db, group)
+            except Exception as e:
+                logger.error(f"Writer failed to commit a group of {len(group)}: {e}")
+            finally:
+                db.close()
+        db.close()
+
+    def _commit_group(self, db: Session, group: list) -> None:
+        while group:
+            results = []
+            failed = None
+            for index, (unit, ctx, future) in enumerate(group):
+                try:
+                    results.append(ctx.run(unit, db))
+                    db.flush()
+                except Exception as e:
+                    failed = (index, e)
+                    break
+
+            if failed is None:
+                try:
+                    db.commit()
+                except Exception as e:
+                    db.rollback()
+                    if len(group) == 1:
+                        group[0][2].set_exception(e)
+                        return
+                    # Isolate whichever unit the commit tripped over
+                    for job in group:
+                        self._commit_group(db, [job])
+                    return
+                for (_, _, future), result in zip(group, results):
+                    future.set_result(result)
+                return
+
+            db.rollback()
+            index, error = failed
+            group[index][2].set_exception(error)
+            group = group[:index] + group[index + 1:]
+
+
+def _write_session() -> Session:
+    # Each transaction takes the write lock before its first read (see
+    # writer_engine), and committed objects stay readable so units can hand
+    # back ids and values.
+    return SessionLocal(bind=writer_engine, expire_on_commit=False)
+
+
+_writer = WriteQueue(settings.write_queue_group_size)
+
+
+def run_write(db: Session, unit: Callable[[Session], T]) -> T:
+    """Execute ``unit(session)`` and commit it, through the writer when enabled.
+
+    The unit always receives a separate write session whose transaction holds
+    the SQLite write lock from its first statement, so what it reads cannot
+    change under it, even from another process. Callers should re-read what
+    they need through ``db``.
+    """
+    if not settings.write_queue_enabled:
+        with _write_session() as w:
+            result = unit(w)
+            w.commit()
+            return result
+    return _writer.submit(unit)
+
+
+def shutdown_writer() -> None:
+    _writer.shutdown()
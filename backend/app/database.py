@@ -1,8 +1,30 @@
+import logging
 import os
-from sqlalchemy import create_engine, event
+from typing import Optional
+
+from sqlalchemy import Column, String, Table, create_engine, event, inspect, text
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
+from app.core.profiling import instrument_engine
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever models gain tables, columns or indexes so that init_db()
+# reconciles the schema once instead of reflecting it on every startup.
+SCHEMA_VERSION = 13
+
+# Single-column indexes superseded by composite ones whose leading column is
+# the same; left in place they only slow down every insert
+_RETIRED_INDEXES = (
+    "ix_audit_logs_user_id",
+    "ix_audit_logs_action",
+    "ix_payouts_seller_id",
+    "ix_messages_dispute_id",
+)
 
 # Ensure data directory exists
 # sqlite:///./foo.db → relative path; sqlite:////data/foo.db → absolute path
@@ -19,22 +41,98 @@ if _db_path:
     if _db_dir:
         os.makedirs(_db_dir, exist_ok=True)
 
+# sqlite:// and sqlite:///:memory: both open a private in-memory database
+_in_memory = make_url(settings.database_url).database in (None, "", ":memory:")
+
+
+def _pool_options(pool_size: int, max_overflow: int) -> dict:
+    # In-memory databases use a singleton pool that takes no sizing arguments
+    if _in_memory:
+        return {}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+
+
 engine = create_engine(
     settings.database_url,
     connect_args={"check_same_thread": False},
     echo=False,
+    **_pool_options(settings.db_pool_size, settings.db_max_overflow),
 )
 
 
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
+def _apply_pragmas(dbapi_connection) -> None:
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout)}")
+    cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.sqlite_cache_size)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    cursor.execute(f"PRAGMA temp_store={settings.sqlite_temp_store}")
+    cursor.execute(f"PRAGMA wal_autocheckpoint={int(settings.sqlite_wal_autocheckpoint)}")
     cursor.close()
 
 
+@event.listens_for(engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    _apply_pragmas(dbapi_connection)
+
+
+# Under WAL, readers never block on the writer, so pure-read routes get their
+# own larger pool of query_only connections and never queue behind checkout.
+# An in-memory database is private to its connection and cannot be shared.
+if _in_memory:
+    read_engine = engine
+else:
+    read_engine = create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False},
+        echo=False,
+        **_pool_options(settings.db_read_pool_size, settings.db_read_max_overflow),
+    )
+
+    @event.listens_for(read_engine, "connect")
+    def set_read_only_pragma(dbapi_connection, connection_record):
+        _apply_pragmas(dbapi_connection)
+        dbapi_connection.execute("PRAGMA query_only=ON")
+
+
+# Write units (app.core.writer) get their own connections that open every
+# transaction with BEGIN IMMEDIATE. pysqlite on its own runs a unit's reads
+# outside any transaction and only BEGINs at the first write, so another
+# process could change a balance or stock level between the read and the
+# write and one of the two updates would be lost.
+if _in_memory:
+    writer_engine = engine
+else:
+    writer_engine = create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False},
+        echo=False,
+        **_pool_options(settings.db_pool_size, settings.db_max_overflow),
+    )
+
+    @event.listens_for(writer_engine, "connect")
+    def set_writer_pragma(dbapi_connection, connection_record):
+        _apply_pragmas(dbapi_connection)
+        # Leave transaction control to the "begin" hook below
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(writer_engine, "begin")
+    def begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+if settings.sql_instrumentation_enabled or settings.slow_query_log_enabled:
+    for _engine in {engine, read_engine, writer_engine}:
+        instrument_engine(_engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 Base = declarative_base()
 
 
@@ -46,6 +144,76 @@ def get_db():
         db.close()
 
 
-def init_db():
-    from app.models import user, product, order, wallet, escrow, dispute, payout, refund, audit, drive  # noqa: F401
-    Base.metadata.create_all(bind=engine)
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+schema_meta = Table(
+    "schema_meta",
+    Base.metadata,
+    Column("key", String(50), primary_key=True),
+    Column("value", String(255), nullable=False),
+)
+
+
+def get_meta(conn: Connection, key: str) -> Optional[str]:
+    try:
+        return conn.execute(text("SELECT value FROM schema_meta WHERE key = :key"), {"key": key}).scalar()
+    except OperationalError:
+        return None
+
+
+def set_meta(conn: Connection, key: str, value: str) -> None:
+    conn.execute(
+        text(
+            "INSERT INTO schema_meta (key, value) VALUES (:key, :value) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value"
+        ),
+        {"key": key, "value": value},
+    )
+
+
+def _add_missing_columns(conn: Connection) -> None:
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable and column.server_default is None:
+                raise RuntimeError(f"Cannot add NOT NULL column {table.name}.{column.name} without a server default")
+            ddl = f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column.type.compile(dialect=conn.dialect)}'
+            if column.server_default is not None:
+                default = column.server_default.arg
+                ddl += f" DEFAULT '{default}'" if isinstance(default, str) else f" DEFAULT {default}"
+            conn.execute(text(ddl))
+            logger.info(f"Added column {table.name}.{column.name}")
+
+
+def init_db() -> bool:
+    """Bring the schema up to SCHEMA_VERSION. Returns False if it was already current."""
+    from app.models import user, product, order, wallet, escrow, dispute, payout, refund, audit, drive, cache, job, counter, rollup  # noqa: F401
+
+    with engine.connect() as conn:
+        if get_meta(conn, "schema_version") == str(SCHEMA_VERSION):
+            return False
+
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+        # create_all skips tables that already exist, including columns and
+        # indexes added to them later
+        _add_missing_columns(conn)
+        # IF NOT EXISTS rather than checkfirst: the inspector cannot see
+        # expression indexes, so checkfirst would try to recreate them
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+        for name in _RETIRED_INDEXES:
+            conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+        set_meta(conn, "schema_version", str(SCHEMA_VERSION))
+    logger.info(f"Database schema migrated to version {SCHEMA_VERSION}")
+    return True
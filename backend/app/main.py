@@ -1,15 +1,22 @@
+import asyncio
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
+from app.core import cache, jobs, profiling
+from app.core.tasks import leader, run_periodically
+from app.core.writer import shutdown_writer
 from app.database import init_db
-from app.routers import admin, auth, disputes, orders, payouts, products, users, wallet, drive
+from app.services import audit_service, payout_service, settlement_service, stats_service
+from app.routers import admin, auth, disputes, orders, payouts, products, seller, users, wallet, drive
 
 logging.basicConfig(
     level=logging.INFO,
@@ -20,11 +27,55 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    started = time.perf_counter()
     logger.info("Starting Mercury Marketplace API...")
-    init_db()
-    logger.info("Database ready")
+    # Route handlers are sync and run in the threadpool so that blocking
+    # SQLite I/O never stalls the event loop; size it per deployment.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+
+    migrated = init_db()
+    logger.info(
+        f"Database ready in {(time.perf_counter() - started) * 1000:.0f} ms "
+        f"(schema {'migrated' if migrated else 'current'})"
+    )
+    cache.bus.start()
+    if leader.acquire():
+        audit_service.replay_spool()
+        payout_service.recover_stuck_payouts()
+        settlement_service.recover_stuck_runs()
+    jobs.worker.start()
+
+    background_jobs = [
+        asyncio.create_task(run_periodically("cache bus", settings.cache_bus_poll_interval, cache.bus.poll)),
+        asyncio.create_task(run_periodically(
+            "cache bus pruning", settings.cache_invalidation_retention, cache.prune_invalidations,
+            leader_only=True,
+        )),
+        asyncio.create_task(run_periodically("audit writer", settings.audit_flush_interval, audit_service.flush)),
+        asyncio.create_task(run_periodically(
+            "audit retention", settings.audit_retention_interval, audit_service.archive_old_audit_logs,
+            leader_only=True,
+        )),
+        asyncio.create_task(run_periodically(
+            "counter recount", settings.counter_recount_interval, stats_service.recount_counters,
+            leader_only=True,
+        )),
+    ]
+    if settings.payout_settlement_mode == "batch":
+        background_jobs.append(asyncio.create_task(run_periodically(
+            "payout settlement", settings.payout_settlement_interval, settlement_service.start_settlement_runs,
+            leader_only=True,
+        )))
+    logger.info(f"Startup complete in {(time.perf_counter() - started) * 1000:.0f} ms")
     yield
     logger.info("Shutting down Mercury Marketplace API")
+    for job in background_jobs:
+        job.cancel()
+    jobs.worker.stop(timeout=settings.job_visibility_timeout)
+    shutdown_writer()
+    audit_service.flush()
+    cache.bus.stop()
+    leader.release()
 
 
 app = FastAPI(
@@ -45,6 +96,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.sql_instrumentation_enabled:
+    @app.middleware("http")
+    async def sql_instrumentation(request: Request, call_next):
+        stats, token = profiling.begin_request(request.url.path)
+        try:
+            response = await call_next(request)
+        finally:
+            profiling.end_request(token)
+        response.headers["Server-Timing"] = stats.server_timing()
+        profiling.report_request(request.method, request.url.path, stats)
+        return response
+
+
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/api/users", tags=["Users"])
 app.include_router(products.router, prefix="/api/products", tags=["Products"])
@@ -52,6 +116,7 @@ app.include_router(orders.router, prefix="/api/orders", tags=["Orders"])
 app.include_router(wallet.router, prefix="/api/wallet", tags=["Wallet"])
 app.include_router(disputes.router, prefix="/api/disputes", tags=["Disputes"])
 app.include_router(payouts.router, prefix="/api/payouts", tags=["Payouts"])
+app.include_router(seller.router, prefix="/api/seller", tags=["Seller"])
 app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
 app.include_router(drive.router, prefix="/api/drive", tags=["Drive"])
 
@@ -5,9 +5,13 @@ from app.models.wallet import Wallet, WalletTransaction, TransactionType
 from app.models.drive import DriveFile
 from app.models.escrow import Escrow, EscrowStatus
 from app.models.dispute import Dispute, Message, DisputeStatus
-from app.models.payout import Payout, PayoutStatus
+from app.models.payout import Payout, PayoutStatus, SettlementRun, SettlementRunStatus
 from app.models.refund import Refund, RefundType, RefundStatus
 from app.models.audit import AuditLog
+from app.models.cache import CacheInvalidation
+from app.models.job import Job, JobStatus
+from app.models.counter import PlatformCounter
+from app.models.rollup import SalesRollup
 
 __all__ = [
     "User", "UserRole",
@@ -17,7 +21,11 @@ __all__ = [
     "DriveFile",
     "Escrow", "EscrowStatus",
     "Dispute", "Message", "DisputeStatus",
-    "Payout", "PayoutStatus",
+    "Payout", "PayoutStatus", "SettlementRun", "SettlementRunStatus",
     "Refund", "RefundType", "RefundStatus",
     "AuditLog",
+    "CacheInvalidation",
+    "Job", "JobStatus",
+    "PlatformCounter",
+    "SalesRollup",
 ]
@@ -1,15 +1,21 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_created_id", "created_at", "id"),
+        Index("ix_audit_logs_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_audit_logs_action_created_id", "action", "created_at", "id"),
+        Index("ix_audit_logs_entity_created_id", "entity_type", "entity_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
-    action = Column(String(100), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    action = Column(String(100), nullable=False)
     entity_type = Column(String(100), nullable=True)
     entity_id = Column(Integer, nullable=True)
     details = Column(Text, nullable=True)
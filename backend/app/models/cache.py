@@ -0,0 +1,13 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+from app.database import Base
+
+
+class CacheInvalidation(Base):
+    __tablename__ = "cache_invalidations"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id = Column(Integer, primary_key=True)
+    namespace = Column(String(100), nullable=False)
+    key = Column(String(255), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
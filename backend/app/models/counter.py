@@ -0,0 +1,102 @@
+from sqlalchemy import Column, Integer, String, event, text
+from app.database import Base
+
+
+class PlatformCounter(Base):
+    """Running totals kept exact by triggers, so stats never scan the big tables."""
+
+    __tablename__ = "platform_counters"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(Integer, default=0, nullable=False)
+
+
+# Exact definition of each counter, used to (re)seed it.
+COUNTER_QUERIES = {
+    "total_users": "SELECT COUNT(*) FROM users",
+    "total_products": "SELECT COUNT(*) FROM products WHERE is_active = 1",
+    "total_orders": "SELECT COUNT(*) FROM orders",
+    "open_disputes": "SELECT COUNT(*) FROM disputes WHERE status IN ('open', 'under_review')",
+}
+
+_OPEN = "('open', 'under_review')"
+
+
+def _bump(counter: str, delta: str) -> str:
+    return f"UPDATE platform_counters SET value = value + ({delta}) WHERE name = '{counter}';"
+
+
+COUNTER_TRIGGERS = {
+    "trg_users_count_insert": f"AFTER INSERT ON users BEGIN {_bump('total_users', '1')} END",
+    "trg_users_count_delete": f"AFTER DELETE ON users BEGIN {_bump('total_users', '-1')} END",
+    "trg_products_count_insert":
+        f"AFTER INSERT ON products WHEN NEW.is_active BEGIN {_bump('total_products', '1')} END",
+    "trg_products_count_delete":
+        f"AFTER DELETE ON products WHEN OLD.is_active BEGIN {_bump('total_products', '-1')} END",
+    "trg_products_count_update":
+        "AFTER UPDATE OF is_active ON products WHEN NEW.is_active IS NOT OLD.is_active "
+        f"BEGIN {_bump('total_products', 'CASE WHEN NEW.is_active THEN 1 ELSE -1 END')} END",
+    "trg_orders_count_insert": f"AFTER INSERT ON orders BEGIN {_bump('total_orders', '1')} END",
+    "trg_orders_count_delete": f"AFTER DELETE ON orders BEGIN {_bump('total_orders', '-1')} END",
+    "trg_disputes_count_insert":
+        f"AFTER INSERT ON disputes WHEN NEW.status IN {_OPEN} BEGIN {_bump('open_disputes', '1')} END",
+    "trg_disputes_count_delete":
+        f"AFTER DELETE ON disputes WHEN OLD.status IN {_OPEN} BEGIN {_bump('open_disputes', '-1')} END",
+    "trg_disputes_count_update":
+        "AFTER UPDATE OF status ON disputes WHEN NEW.status IS NOT OLD.status "
+        f"BEGIN {_bump('open_disputes', f'(NEW.status IN {_OPEN}) - (OLD.status IN {_OPEN})')} END",
+}
+
+
+def recount(conn) -> None:
+    """Reset every counter to its exact value.
+
+    Seeds the counters when the table is created. Each reset is a single
+    UPDATE that counts while holding the write lock, which is fine inside the
+    migration but too long for the periodic check (see ``measure_drift``).
+    """
+    for name, query in COUNTER_QUERIES.items():
+        conn.execute(
+            text("INSERT INTO platform_counters (name, value) VALUES (:name, 0) ON CONFLICT (name) DO NOTHING"),
+            {"name": name},
+        )
+        conn.execute(text(f"UPDATE platform_counters SET value = ({query}) WHERE name = :name"), {"name": name})
+
+
+def measure_drift(conn) -> dict[str, int]:
+    """How far each counter is from its exact value, for the counters that are off.
+
+    The counts and the stored values come from one statement, so they share a
+    snapshot and the scans run without the write lock.
+    """
+    exact = " UNION ALL ".join(
+        f"SELECT '{name}' AS name, ({query}) AS exact" for name, query in COUNTER_QUERIES.items()
+    )
+    rows = conn.exec_driver_sql(
+        f"SELECT e.name, e.exact, c.value FROM ({exact}) e LEFT JOIN platform_counters c ON c.name = e.name"
+    ).all()
+    return {name: exact - (value or 0) for name, exact, value in rows if exact != value}
+
+
+def apply_drift(conn, drift: dict[str, int]) -> None:
+    """Shift counters by the measured drift.
+
+    Triggers move a counter and its exact count together, so the drift seen in
+    the snapshot still holds after later writes; adding it corrects the
+    counter without recounting under the write lock.
+    """
+    for name, delta in drift.items():
+        conn.execute(
+            text(
+                "INSERT INTO platform_counters (name, value) VALUES (:name, :delta) "
+                "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value"
+            ),
+            {"name": name, "delta": delta},
+        )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_counter_triggers(target, connection, **kw) -> None:
+    for name, body in COUNTER_TRIGGERS.items():
+        connection.execute(text(f"CREATE TRIGGER IF NOT EXISTS {name} {body}"))
+    recount(connection)
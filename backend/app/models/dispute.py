@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -15,6 +15,11 @@ class DisputeStatus(str, enum.Enum):
 
 class Dispute(Base):
     __tablename__ = "disputes"
+    __table_args__ = (
+        Index("ix_disputes_created_id", "created_at", "id"),
+        Index("ix_disputes_buyer_created_id", "buyer_id", "created_at", "id"),
+        Index("ix_disputes_seller_created_id", "seller_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id"), unique=True, nullable=False, index=True)
@@ -37,9 +42,12 @@ class Dispute(Base):
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_dispute_created_id", "dispute_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    dispute_id = Column(Integer, ForeignKey("disputes.id", ondelete="CASCADE"), nullable=False, index=True)
+    dispute_id = Column(Integer, ForeignKey("disputes.id", ondelete="CASCADE"), nullable=False)
     sender_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -12,6 +12,7 @@ class DriveFile(Base):
     file_path = Column(String(1000), nullable=False)
     content_type = Column(String(100), nullable=True)
     size = Column(Integer, nullable=False, default=0)
+    checksum = Column(String(64), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     seller = relationship("User", back_populates="drive_files")
@@ -0,0 +1,33 @@
+import enum
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, Index
+from app.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_run_at", "status", "run_at"),
+        Index("ix_jobs_kind_ref", "kind", "ref"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False)
+    ref = Column(String(100), nullable=True)
+    payload = Column(Text, nullable=False, default="{}")
+    status = Column(Enum(JobStatus), default=JobStatus.queued, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_by = Column(String(100), nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Float, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Float, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -30,6 +30,9 @@ VALID_TRANSITIONS: dict[str, set[str]] = {
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_created_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     buyer_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -50,6 +53,9 @@ class Order(Base):
 
 class OrderItem(Base):
     __tablename__ = "order_items"
+    __table_args__ = (
+        Index("ix_order_items_seller_order", "seller_id", "order_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Float, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Float, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -12,11 +12,20 @@ class PayoutStatus(str, enum.Enum):
     failed = "failed"
 
 
+class SettlementRunStatus(str, enum.Enum):
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
 class Payout(Base):
     __tablename__ = "payouts"
+    __table_args__ = (
+        Index("ix_payouts_seller_created_id", "seller_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    seller_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    seller_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     amount = Column(Float, nullable=False)
     status = Column(Enum(PayoutStatus), default=PayoutStatus.pending, nullable=False)
     method = Column(String(50), default="bank_transfer", nullable=False)
@@ -25,5 +34,23 @@ class Payout(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     processed_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
+    settlement_run_id = Column(Integer, ForeignKey("settlement_runs.id"), nullable=True, index=True)
 
     seller = relationship("User", back_populates="payouts")
+    settlement_run = relationship("SettlementRun", back_populates="payouts")
+
+
+class SettlementRun(Base):
+    __tablename__ = "settlement_runs"
+
+    id = Column(Integer, primary_key=True)
+    method = Column(String(50), nullable=False)
+    status = Column(Enum(SettlementRunStatus), default=SettlementRunStatus.running, nullable=False)
+    payout_count = Column(Integer, default=0, nullable=False)
+    total_amount = Column(Float, default=0.0, nullable=False)
+    file_path = Column(String(500), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+
+    payouts = relationship("Payout", back_populates="settlement_run")
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Date, Float, Index, Integer, String
+from app.database import Base
+
+
+class SalesRollup(Base):
+    """Sales per day, seller and category, maintained as orders move money.
+
+    Each figure is booked on the day its event happened: GMV when the order
+    is placed, released when escrow pays the seller, refunds when processed.
+    Uncategorised products roll up under ``category = ''``. An order spanning
+    several categories counts once, in ``order_count`` of its first category
+    (its refunds likewise in ``refund_count``), so counts can be summed.
+    """
+
+    __tablename__ = "sales_rollups"
+    __table_args__ = (
+        Index("ix_sales_rollups_seller_day", "seller_id", "day"),
+        Index("ix_sales_rollups_category_day", "category", "day"),
+    )
+
+    day = Column(Date, primary_key=True)
+    seller_id = Column(Integer, primary_key=True)
+    category = Column(String(100), primary_key=True, default="")
+    order_count = Column(Integer, default=0, nullable=False)
+    units = Column(Integer, default=0, nullable=False)
+    gmv = Column(Float, default=0.0, nullable=False)
+    released_amount = Column(Float, default=0.0, nullable=False)
+    refund_count = Column(Integer, default=0, nullable=False)
+    refund_amount = Column(Float, default=0.0, nullable=False)
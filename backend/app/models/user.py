@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Text, Index, func
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -13,6 +13,9 @@ class UserRole(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -39,3 +42,10 @@ class User(Base):
     messages = relationship("Message", back_populates="sender")
     payouts = relationship("Payout", back_populates="seller")
     audit_logs = relationship("AuditLog", back_populates="user")
+
+
+# Case-folded expression indexes for admin prefix search; queries must use
+# the same ``lower(column)`` expression for SQLite to pick them.
+Index("ix_users_email_lower", func.lower(User.email))
+Index("ix_users_username_lower", func.lower(User.username))
+Index("ix_users_full_name_lower", func.lower(User.full_name))
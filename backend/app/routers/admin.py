@@ -1,22 +1,52 @@
 import logging
-from datetime import datetime
-from typing import Optional
+import os
+import string
+from datetime import date, datetime, timedelta
+from typing import Literal, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_admin
+from app.config import settings
+from app.core import profiling
+from app.core.deps import get_current_admin, get_current_admin_read
+from app.core.pagination import keyset_page
+from app.core.realtime import hub
+from app.core.writer import run_write
 from app.core.email import send_dispute_resolved, send_refund_notification
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.audit import AuditLog
 from app.models.dispute import Dispute, DisputeStatus
 from app.models.order import Order, OrderStatus
-from app.models.user import User
-from app.schemas.dispute import ResolveDisputeRequest
+from app.models.payout import SettlementRun, SettlementRunStatus
+from app.models.rollup import SalesRollup
+from app.schemas.analytics import SalesPoint, SalesSeriesResponse
+from app.models.user import User, UserRole
+from app.models.wallet import Wallet
+from app.schemas.audit import AuditLogListResponse, AuditLogResponse
+from app.schemas.bulk import BulkUserActionRequest, BulkUserActionResponse
+from app.schemas.dispute import DisputeListResponse, ResolveDisputeRequest
 from app.schemas.order import OrderResponse
+from app.schemas.payout import SettlementRunListResponse, SettlementRunRequest, SettlementRunResponse
 from app.schemas.user import UserResponse
-from app.services.order_service import process_refund, release_escrow_to_seller
+from app.services.audit_service import record_audit
+from app.services.bulk_service import apply_bulk_action
+from app.services import dispute_service
+from app.services.export_service import (
+    MEDIA_TYPES,
+    ORDER_COLUMNS,
+    USER_COLUMNS,
+    ExportFormat,
+    order_id_range,
+    order_rows,
+    stream_export,
+    user_rows,
+)
+from app.services.settlement_service import start_settlement_runs
+from app.services.stats_service import get_platform_stats
 from app.services.wallet_service import admin_adjust_balance
 
 router = APIRouter()
@@ -33,52 +63,84 @@ class AdminUserResponse(UserResponse):
     wallet_pending: Optional[float] = None
 
 
-@router.get("/users", response_model=list[UserResponse])
-async def list_all_users(
-    page: int = Query(1, ge=1),
-    per_page: int = Query(50, ge=1, le=200),
-    search: Optional[str] = Query(None),
-    admin: User = Depends(get_current_admin),
-    db: Session = Depends(get_db),
-):
-    query = db.query(User)
-    if search:
-        like = f"%{search}%"
-        from sqlalchemy import or_
-        query = query.filter(or_(User.email.ilike(like), User.username.ilike(like)))
+class AdminUserListResponse(BaseModel):
+    items: list[AdminUserResponse]
+    next_cursor: Optional[str] = None
+
+
+# SQLite's lower() folds only A-Z, so the search term is folded the same way
+# to compare against the lower(column) indexes; "É" matches "Émile", "é" does not.
+_ASCII_FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 
-    users = query.order_by(User.created_at.desc()).offset((page - 1) * per_page).limit(per_page).all()
-    return users
 
+def _prefix_match(column, prefix: str):
+    # A half-open range on lower(column) seeks the expression index, where
+    # ILIKE '%q%' (or even 'q%' on SQLite) has to scan every row.
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    folded = func.lower(column)
+    return and_(folded >= prefix, folded < upper)
+
+
+def _admin_users(db: Session):
+    return (
+        db.query(User, Wallet.balance, Wallet.pending_balance)
+        .outerjoin(Wallet, Wallet.user_id == User.id)
+    )
+
+
+def _admin_user_response(row) -> AdminUserResponse:
+    user, balance, pending = row
+    return AdminUserResponse.model_validate(user).model_copy(
+        update={"wallet_balance": balance or 0, "wallet_pending": pending or 0}
+    )
 
-@router.get("/users/{user_id}")
-async def get_user_detail(
+
+@router.get("/users", response_model=AdminUserListResponse)
+def list_all_users(
+    search: Optional[str] = Query(None, max_length=255),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    admin: User = Depends(get_current_admin_read),
+    db: Session = Depends(get_read_db),
+):
+    """Newest accounts first, optionally narrowed by ``search``.
+
+    ``search`` matches the start of the email, username or full name (not a
+    substring), or an exact user id. Case is ignored for ASCII letters only,
+    like SQLite's ``lower()``.
+    """
+    query = _admin_users(db)
+    prefix = (search or "").strip().translate(_ASCII_FOLD)
+    if prefix:
+        matches = [
+            _prefix_match(User.email, prefix),
+            _prefix_match(User.username, prefix),
+            _prefix_match(User.full_name, prefix),
+        ]
+        if prefix.isdigit():
+            matches.append(User.id == int(prefix))
+        query = query.filter(or_(*matches))
+
+    rows, next_cursor = keyset_page(
+        query, User.created_at, User.id, cursor, limit, key=lambda row: (row[0].created_at, row[0].id)
+    )
+    return AdminUserListResponse(items=[_admin_user_response(row) for row in rows], next_cursor=next_cursor)
+
+
+@router.get("/users/{user_id}", response_model=AdminUserResponse)
+def get_user_detail(
     user_id: int,
-    admin: User = Depends(get_current_admin),
-    db: Session = Depends(get_db),
+    admin: User = Depends(get_current_admin_read),
+    db: Session = Depends(get_read_db),
 ):
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    row = _admin_users(db).filter(User.id == user_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
-
-    wallet = user.wallet
-    return {
-        "id": user.id,
-        "email": user.email,
-        "username": user.username,
-        "full_name": user.full_name,
-        "role": user.role,
-        "is_active": user.is_active,
-        "is_verified": user.is_verified,
-        "is_frozen": user.is_frozen,
-        "created_at": user.created_at,
-        "wallet_balance": wallet.balance if wallet else 0,
-        "wallet_pending": wallet.pending_balance if wallet else 0,
-    }
+    return _admin_user_response(row)
 
 
 @router.put("/users/{user_id}/freeze")
-async def freeze_account(
+def freeze_account(
     user_id: int,
     admin: User = Depends(get_current_admin),
     db: Session = Depends(get_db),
@@ -91,18 +153,19 @@ async def freeze_account(
         raise HTTPException(status_code=400, detail="Cannot freeze administrator accounts")
 
     user.is_frozen = True
-    db.add(AuditLog(
+    record_audit(
+        db,
         user_id=admin.id,
         action="account_frozen",
         entity_type="user",
         entity_id=user.id,
-    ))
+    )
     db.commit()
     return {"message": f"Account {user.username} has been frozen"}
 
 
 @router.put("/users/{user_id}/unfreeze")
-async def unfreeze_account(
+def unfreeze_account(
     user_id: int,
     admin: User = Depends(get_current_admin),
     db: Session = Depends(get_db),
@@ -112,18 +175,19 @@ async def unfreeze_account(
         raise HTTPException(status_code=404, detail="User not found")
 
     user.is_frozen = False
-    db.add(AuditLog(
+    record_audit(
+        db,
         user_id=admin.id,
         action="account_unfrozen",
         entity_type="user",
         entity_id=user.id,
-    ))
+    )
     db.commit()
     return {"message": f"Account {user.username} has been unfrozen"}
 
 
 @router.put("/users/{user_id}/verify")
-async def manually_verify_user(
+def manually_verify_user(
     user_id: int,
     admin: User = Depends(get_current_admin),
     db: Session = Depends(get_db),
@@ -133,43 +197,116 @@ async def manually_verify_user(
         raise HTTPException(status_code=404, detail="User not found")
 
     user.is_verified = True
-    user.verification_token = None
     db.commit()
     return {"message": f"User {user.username} has been verified"}
 
 
 @router.post("/users/{user_id}/wallet/adjust")
-async def adjust_wallet(
+def adjust_wallet(
     user_id: int,
     body: WalletAdjustRequest,
     admin: User = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    def unit(w: Session) -> None:
+        user = w.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        admin_adjust_balance(w, user_id, body.amount, body.description)
+
+        record_audit(
+            w,
+            user_id=admin.id,
+            action="wallet_adjusted",
+            entity_type="user",
+            entity_id=user_id,
+            details=f"${body.amount:+.2f} — {body.description}",
+        )
+
+    run_write(db, unit)
+
+    return {"message": f"Wallet adjusted by ${body.amount:+.2f}", "description": body.description}
+
 
-    admin_adjust_balance(db, user_id, body.amount, body.description)
+@router.post("/users/bulk", response_model=BulkUserActionResponse)
+def bulk_user_action(
+    body: BulkUserActionRequest,
+    admin: User = Depends(get_current_admin),
+):
+    """Freeze, unfreeze, verify or adjust the wallets of many users at once."""
+    if len(body.user_ids) > settings.bulk_action_max_ids:
+        raise HTTPException(status_code=400, detail=f"At most {settings.bulk_action_max_ids} users per request")
+    if body.action == "wallet_adjust" and (body.amount is None or not body.description):
+        raise HTTPException(status_code=400, detail="wallet_adjust requires an amount and a description")
+
+    results = apply_bulk_action(admin.id, body.action, body.user_ids, body.amount, body.description)
+    return BulkUserActionResponse(
+        action=body.action,
+        requested=len(results),
+        updated=sum(1 for r in results if r.outcome == "updated"),
+        results=results,
+    )
 
-    db.add(AuditLog(
+
+def _export_response(db: Session, admin: User, name: str, stmt, columns, fmt: ExportFormat, filters: dict):
+    record_audit(
+        db,
         user_id=admin.id,
-        action="wallet_adjusted",
-        entity_type="user",
-        entity_id=user_id,
-        details=f"${body.amount:+.2f} — {body.description}",
-    ))
+        action="data_exported",
+        details=" ".join([f"{name}.{fmt}"] + [f"{k}={v}" for k, v in filters.items() if v is not None]),
+    )
     db.commit()
+    filename = f"{name}_{datetime.utcnow():%Y%m%d_%H%M%S}.{fmt}"
+    return StreamingResponse(
+        stream_export(stmt, columns, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
-    return {"message": f"Wallet adjusted by ${body.amount:+.2f}", "description": body.description}
+
+@router.get("/exports/orders")
+def export_orders(
+    fmt: ExportFormat = Query("csv", alias="format"),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None),
+    status_filter: Optional[OrderStatus] = Query(None, alias="status"),
+    admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """Stream every matching order item, one row each, in order id order."""
+    stmt = order_rows(order_id_range(db, since, until), since, until, status_filter)
+    return _export_response(
+        db, admin, "orders", stmt, ORDER_COLUMNS, fmt,
+        {"since": since, "until": until, "status": status_filter and status_filter.value},
+    )
+
+
+@router.get("/exports/users")
+def export_users(
+    fmt: ExportFormat = Query("csv", alias="format"),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None),
+    role: Optional[UserRole] = Query(None),
+    frozen: Optional[bool] = Query(None),
+    admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """Stream matching accounts with their wallet balances, oldest first."""
+    stmt = user_rows(since, until, role, frozen)
+    return _export_response(
+        db, admin, "users", stmt, USER_COLUMNS, fmt,
+        {"since": since, "until": until, "role": role and role.value, "frozen": frozen},
+    )
 
 
 @router.get("/orders")
-async def list_all_orders(
+def list_all_orders(
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=200),
     status_filter: Optional[str] = Query(None, alias="status"),
-    admin: User = Depends(get_current_admin),
-    db: Session = Depends(get_db),
+    admin: User = Depends(get_current_admin_read),
+    db: Session = Depends(get_read_db),
 ):
     query = db.query(Order)
 
@@ -192,66 +329,43 @@ async def list_all_orders(
     }
 
 
-@router.get("/disputes")
-async def list_all_disputes(
-    admin: User = Depends(get_current_admin),
-    db: Session = Depends(get_db),
+@router.get("/disputes", response_model=DisputeListResponse)
+def list_all_disputes(
+    status_filter: Optional[DisputeStatus] = Query(None, alias="status"),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    admin: User = Depends(get_current_admin_read),
+    db: Session = Depends(get_read_db),
 ):
-    disputes = db.query(Dispute).order_by(Dispute.created_at.desc()).all()
-    from app.routers.disputes import build_dispute_response
-    return [build_dispute_response(d) for d in disputes]
+    from app.routers.disputes import dispute_page
+    query = db.query(Dispute)
+    if status_filter:
+        query = query.filter(Dispute.status == status_filter)
+    return dispute_page(db, query, cursor, limit)
 
 
 @router.put("/disputes/{dispute_id}/resolve")
-async def resolve_dispute(
+def resolve_dispute(
     dispute_id: int,
     body: ResolveDisputeRequest,
     background_tasks: BackgroundTasks,
     admin: User = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
-    dispute = db.query(Dispute).filter(Dispute.id == dispute_id).first()
-    if not dispute:
-        raise HTTPException(status_code=404, detail="Dispute not found")
-
-    if dispute.status in (DisputeStatus.resolved_buyer, DisputeStatus.resolved_seller):
-        raise HTTPException(status_code=400, detail="This dispute is already resolved")
-
-    order = dispute.order
-    now = datetime.utcnow()
+    run_write(db, lambda w: dispute_service.resolve_dispute(
+        w, dispute_id, admin.id, body.resolution, body.admin_notes, body.refund_buyer
+    ))
+    hub.notify(dispute_id)
 
+    dispute = db.query(Dispute).filter(Dispute.id == dispute_id).first()
     if body.refund_buyer:
-        process_refund(db, order, order.total_amount, body.resolution, admin.id)
-        order.status = OrderStatus.refunded
-        dispute.status = DisputeStatus.resolved_buyer
-
         background_tasks.add_task(
-            send_refund_notification, dispute.buyer.email, order.id, order.total_amount
+            send_refund_notification, dispute.buyer.email, dispute.order_id, dispute.order.total_amount
         )
-    else:
-        release_escrow_to_seller(db, order)
-        order.status = OrderStatus.completed
-        dispute.status = DisputeStatus.resolved_seller
-
-    order.updated_at = now
-    dispute.resolution = body.resolution
-    dispute.admin_notes = body.admin_notes
-    dispute.resolved_by_id = admin.id
-    dispute.resolved_at = now
-
-    db.add(AuditLog(
-        user_id=admin.id,
-        action="dispute_resolved",
-        entity_type="dispute",
-        entity_id=dispute.id,
-        details=f"refund_buyer={body.refund_buyer}",
-    ))
-    db.commit()
-
     background_tasks.add_task(
         send_dispute_resolved,
         dispute.buyer.email if body.refund_buyer else dispute.seller.email,
-        order.id,
+        dispute.order_id,
         body.resolution,
     )
 
@@ -260,23 +374,167 @@ async def resolve_dispute(
 
 
 @router.get("/stats")
-async def get_platform_stats(
-    admin: User = Depends(get_current_admin),
-    db: Session = Depends(get_db),
+def platform_stats(
+    admin: User = Depends(get_current_admin_read),
+    db: Session = Depends(get_read_db),
+):
+    return get_platform_stats(db)
+
+
+_PERIODS = {
+    "day": SalesRollup.day,
+    # Weeks start on Monday
+    "week": func.date(SalesRollup.day, "weekday 0", "-6 days"),
+    "month": func.strftime("%Y-%m", SalesRollup.day),
+}
+
+
+@router.get("/analytics/sales", response_model=SalesSeriesResponse)
+def sales_series(
+    since: Optional[date] = Query(None),
+    until: Optional[date] = Query(None),
+    granularity: Literal["day", "week", "month"] = Query("day"),
+    seller_id: Optional[int] = Query(None),
+    category: Optional[str] = Query(None, max_length=100),
+    admin: User = Depends(get_current_admin_read),
+    db: Session = Depends(get_read_db),
+):
+    until = until or datetime.utcnow().date()
+    since = since or until - timedelta(days=30)
+    if since > until:
+        raise HTTPException(status_code=400, detail="since must not be after until")
+
+    period = _PERIODS[granularity].label("period")
+    query = db.query(
+        period,
+        func.sum(SalesRollup.order_count),
+        func.sum(SalesRollup.units),
+        func.sum(SalesRollup.gmv),
+        func.sum(SalesRollup.released_amount),
+        func.sum(SalesRollup.refund_count),
+        func.sum(SalesRollup.refund_amount),
+    ).filter(SalesRollup.day >= since, SalesRollup.day <= until)
+    if seller_id is not None:
+        query = query.filter(SalesRollup.seller_id == seller_id)
+    if category is not None:
+        query = query.filter(SalesRollup.category == category)
+
+    rows = query.group_by(period).order_by(period).all()
+    return SalesSeriesResponse(
+        granularity=granularity,
+        since=since,
+        until=until,
+        items=[
+            SalesPoint(
+                period=str(p),
+                order_count=orders,
+                units=units,
+                gmv=round(gmv, 2),
+                released_amount=round(released, 2),
+                refund_count=refunds,
+                refund_amount=round(refunded, 2),
+            )
+            for p, orders, units, gmv, released, refunds, refunded in rows
+        ],
+    )
+
+
+@router.get("/audit-logs", response_model=AuditLogListResponse)
+def search_audit_logs(
+    user_id: Optional[int] = Query(None),
+    action: Optional[str] = Query(None, max_length=100),
+    entity_type: Optional[str] = Query(None, max_length=100),
+    entity_id: Optional[int] = Query(None),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=500),
+    admin: User = Depends(get_current_admin_read),
+    db: Session = Depends(get_read_db),
 ):
-    from app.models.product import Product
-    from app.models.wallet import Wallet
+    if entity_id is not None and entity_type is None:
+        raise HTTPException(status_code=400, detail="entity_id requires entity_type")
+
+    query = db.query(AuditLog)
+    if user_id is not None:
+        query = query.filter(AuditLog.user_id == user_id)
+    if action:
+        query = query.filter(AuditLog.action == action)
+    if entity_type:
+        query = query.filter(AuditLog.entity_type == entity_type)
+    if entity_id is not None:
+        query = query.filter(AuditLog.entity_id == entity_id)
+    if since:
+        query = query.filter(AuditLog.created_at >= since)
+    if until:
+        query = query.filter(AuditLog.created_at < until)
+
+    logs, next_cursor = keyset_page(query, AuditLog.created_at, AuditLog.id, cursor, limit)
+    return AuditLogListResponse(
+        items=[AuditLogResponse.model_validate(log) for log in logs],
+        next_cursor=next_cursor,
+    )
 
-    total_users = db.query(User).count()
-    total_products = db.query(Product).filter(Product.is_active == True).count()
-    total_orders = db.query(Order).count()
-    open_disputes = db.query(Dispute).filter(
-        Dispute.status.in_([DisputeStatus.open, DisputeStatus.under_review])
-    ).count()
 
+@router.get("/slow-queries")
+def list_slow_queries(admin: User = Depends(get_current_admin)):
     return {
-        "total_users": total_users,
-        "total_products": total_products,
-        "total_orders": total_orders,
-        "open_disputes": open_disputes,
+        "enabled": settings.slow_query_log_enabled,
+        "threshold_ms": settings.slow_query_threshold_ms,
+        "items": profiling.get_slow_queries(),
     }
+
+
+@router.delete("/slow-queries", status_code=204)
+def clear_slow_queries(admin: User = Depends(get_current_admin)):
+    profiling.clear_slow_queries()
+
+
+@router.post("/settlements", response_model=list[SettlementRunResponse], status_code=201)
+def start_settlement(
+    body: SettlementRunRequest,
+    admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    run_ids = start_settlement_runs(body.method)
+    if run_ids:
+        record_audit(
+            db,
+            user_id=admin.id,
+            action="settlement_started",
+            entity_type="settlement_run",
+            details=f"runs={run_ids}",
+        )
+        db.commit()
+    runs = db.query(SettlementRun).filter(SettlementRun.id.in_(run_ids)).order_by(SettlementRun.id).all()
+    return [SettlementRunResponse.model_validate(r) for r in runs]
+
+
+@router.get("/settlements", response_model=SettlementRunListResponse)
+def list_settlements(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    admin: User = Depends(get_current_admin_read),
+    db: Session = Depends(get_read_db),
+):
+    runs, next_cursor = keyset_page(
+        db.query(SettlementRun), SettlementRun.created_at, SettlementRun.id, cursor, limit
+    )
+    return SettlementRunListResponse(
+        items=[SettlementRunResponse.model_validate(r) for r in runs],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/settlements/{run_id}/file")
+def download_settlement_file(
+    run_id: int,
+    admin: User = Depends(get_current_admin_read),
+    db: Session = Depends(get_read_db),
+):
+    run = db.query(SettlementRun).filter(SettlementRun.id == run_id).first()
+    if not run:
+        raise HTTPException(status_code=404, detail="Settlement run not found")
+    if run.status != SettlementRunStatus.completed or not run.file_path:
+        raise HTTPException(status_code=409, detail="Settlement file is not ready")
+    return FileResponse(run.file_path, media_type="text/csv", filename=os.path.basename(run.file_path))
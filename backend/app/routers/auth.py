@@ -1,11 +1,13 @@
 import logging
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.core.deps import get_current_user
 from app.core.email import send_password_reset_email
+from app.core.ratelimit import TokenBucketLimiter
 from app.core.security import (
     create_access_token,
     create_refresh_token,
@@ -30,9 +32,27 @@ from app.schemas.user import UserResponse
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_login_ip_limiter = TokenBucketLimiter(settings.login_ip_burst, settings.login_ip_per_minute)
+_login_email_limiter = TokenBucketLimiter(settings.login_email_burst, settings.login_email_per_minute)
+
+
+def _throttle_login(request: Request, email: str) -> None:
+    if not settings.login_rate_limit_enabled:
+        return
+
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = _login_ip_limiter.hit(client_ip) or _login_email_limiter.hit(email.lower())
+    if retry_after:
+        logger.warning(f"Login throttled: ip={client_ip} email={email}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(
+def register(
     body: RegisterRequest,
     db: Session = Depends(get_db),
 ):
@@ -67,7 +87,9 @@ async def register(
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(body: LoginRequest, db: Session = Depends(get_db)):
+def login(body: LoginRequest, request: Request, db: Session = Depends(get_db)):
+    _throttle_login(request, body.email)
+
     user = db.query(User).filter(User.email == body.email).first()
 
     if not user or not verify_password(body.password, user.hashed_password):
@@ -90,7 +112,7 @@ async def login(body: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(body: RefreshRequest, db: Session = Depends(get_db)):
+def refresh_token(body: RefreshRequest, db: Session = Depends(get_db)):
     payload = decode_token(body.refresh_token)
 
     if not payload or payload.get("type") != "refresh":
@@ -110,7 +132,7 @@ async def refresh_token(body: RefreshRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/forgot-password")
-async def forgot_password(
+def forgot_password(
     body: ForgotPasswordRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
@@ -129,7 +151,7 @@ async def forgot_password(
 
 
 @router.post("/reset-password")
-async def reset_password(body: ResetPasswordRequest, db: Session = Depends(get_db)):
+def reset_password(body: ResetPasswordRequest, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.reset_token == body.token).first()
 
     if not user or not user.reset_token_expires or user.reset_token_expires < datetime.utcnow():
@@ -1,39 +1,60 @@
+import asyncio
+import json
 import logging
 from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import func
+from sqlalchemy.orm import Query as SAQuery, Session, joinedload, selectinload
 
-from app.core.deps import get_current_user
+from app.core.deps import authenticate_token, get_current_user, get_current_user_read
 from app.core.email import send_dispute_opened
-from app.database import get_db
-from app.models.audit import AuditLog
+from app.core.pagination import keyset_page
+from app.core.realtime import hub
+from app.database import ReadSessionLocal, SessionLocal, get_db, get_read_db
 from app.models.dispute import Dispute, DisputeStatus, Message
 from app.models.order import Order, OrderStatus, VALID_TRANSITIONS
 from app.models.user import User
 from app.schemas.dispute import (
     DisputeCreate,
+    DisputeListResponse,
     DisputeResponse,
+    DisputeSummaryResponse,
     MessageCreate,
+    MessageListResponse,
     MessageResponse,
 )
+from app.services.audit_service import record_audit
+from app.services.dispute_service import post_message
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def build_message_response(message: Message) -> MessageResponse:
+    return MessageResponse(
+        id=message.id,
+        dispute_id=message.dispute_id,
+        sender_id=message.sender_id,
+        sender_username=message.sender.username if message.sender else None,
+        content=message.content,
+        created_at=message.created_at,
+    )
+
+
 def build_dispute_response(dispute: Dispute) -> DisputeResponse:
-    messages = [
-        MessageResponse(
-            id=m.id,
-            dispute_id=m.dispute_id,
-            sender_id=m.sender_id,
-            sender_username=m.sender.username if m.sender else None,
-            content=m.content,
-            created_at=m.created_at,
-        )
-        for m in dispute.messages
-    ]
     return DisputeResponse(
         id=dispute.id,
         order_id=dispute.order_id,
@@ -47,48 +68,133 @@ def build_dispute_response(dispute: Dispute) -> DisputeResponse:
         resolution=dispute.resolution,
         created_at=dispute.created_at,
         resolved_at=dispute.resolved_at,
-        messages=messages,
+        messages=[build_message_response(m) for m in dispute.messages],
     )
 
 
-@router.get("", response_model=list[DisputeResponse])
-async def list_disputes(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    if current_user.role == "admin":
-        disputes = db.query(Dispute).order_by(Dispute.created_at.desc()).all()
-    else:
-        disputes = (
-            db.query(Dispute)
-            .filter(
-                (Dispute.buyer_id == current_user.id) | (Dispute.seller_id == current_user.id)
-            )
-            .order_by(Dispute.created_at.desc())
+def build_dispute_summaries(db: Session, disputes: list[Dispute]) -> list[DisputeSummaryResponse]:
+    """Summaries with a message count and the latest message, in two queries per page."""
+    counts: dict[int, int] = {}
+    last_messages: dict[int, Message] = {}
+    if disputes:
+        rows = (
+            db.query(Message.dispute_id, func.count(Message.id), func.max(Message.id))
+            .filter(Message.dispute_id.in_([d.id for d in disputes]))
+            .group_by(Message.dispute_id)
             .all()
         )
-    return [build_dispute_response(d) for d in disputes]
+        counts = {dispute_id: count for dispute_id, count, _ in rows}
+        if rows:
+            last_messages = {
+                m.dispute_id: m
+                for m in db.query(Message)
+                .options(joinedload(Message.sender))
+                .filter(Message.id.in_([last_id for _, _, last_id in rows]))
+            }
 
+    return [
+        DisputeSummaryResponse(
+            id=d.id,
+            order_id=d.order_id,
+            buyer_id=d.buyer_id,
+            seller_id=d.seller_id,
+            buyer_username=d.buyer.username if d.buyer else None,
+            seller_username=d.seller.username if d.seller else None,
+            reason=d.reason,
+            status=d.status,
+            admin_notes=d.admin_notes,
+            resolution=d.resolution,
+            created_at=d.created_at,
+            resolved_at=d.resolved_at,
+            message_count=counts.get(d.id, 0),
+            last_message=(
+                build_message_response(last_messages[d.id]) if d.id in last_messages else None
+            ),
+        )
+        for d in disputes
+    ]
 
-@router.get("/{dispute_id}", response_model=DisputeResponse)
-async def get_dispute(
-    dispute_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    dispute = db.query(Dispute).filter(Dispute.id == dispute_id).first()
+
+def dispute_page(
+    db: Session, query: SAQuery, cursor: Optional[str], limit: int
+) -> DisputeListResponse:
+    query = query.options(joinedload(Dispute.buyer), joinedload(Dispute.seller))
+    disputes, next_cursor = keyset_page(query, Dispute.created_at, Dispute.id, cursor, limit)
+    return DisputeListResponse(
+        items=build_dispute_summaries(db, disputes), next_cursor=next_cursor
+    )
+
+
+def get_accessible_dispute(db: Session, dispute_id: int, user: User, *options) -> Dispute:
+    dispute = db.query(Dispute).options(*options).filter(Dispute.id == dispute_id).first()
     if not dispute:
         raise HTTPException(status_code=404, detail="Dispute not found")
 
-    is_participant = dispute.buyer_id == current_user.id or dispute.seller_id == current_user.id
-    if not is_participant and current_user.role != "admin":
+    is_participant = dispute.buyer_id == user.id or dispute.seller_id == user.id
+    if not is_participant and user.role != "admin":
         raise HTTPException(status_code=403, detail="Access denied")
+    return dispute
+
+
+@router.get("", response_model=DisputeListResponse)
+def list_disputes(
+    status_filter: Optional[DisputeStatus] = Query(None, alias="status"),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
+):
+    query = db.query(Dispute)
+    if current_user.role != "admin":
+        query = query.filter(
+            (Dispute.buyer_id == current_user.id) | (Dispute.seller_id == current_user.id)
+        )
+    if status_filter:
+        query = query.filter(Dispute.status == status_filter)
+    return dispute_page(db, query, cursor, limit)
 
+
+@router.get("/{dispute_id}", response_model=DisputeResponse)
+def get_dispute(
+    dispute_id: int,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
+):
+    dispute = get_accessible_dispute(
+        db,
+        dispute_id,
+        current_user,
+        joinedload(Dispute.buyer),
+        joinedload(Dispute.seller),
+        selectinload(Dispute.messages).joinedload(Message.sender),
+    )
     return build_dispute_response(dispute)
 
 
+@router.get("/{dispute_id}/messages", response_model=MessageListResponse)
+def list_messages(
+    dispute_id: int,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
+):
+    get_accessible_dispute(db, dispute_id, current_user)
+    query = (
+        db.query(Message)
+        .options(joinedload(Message.sender))
+        .filter(Message.dispute_id == dispute_id)
+    )
+    messages, next_cursor = keyset_page(
+        query, Message.created_at, Message.id, cursor, limit, oldest_first=True
+    )
+    return MessageListResponse(
+        items=[build_message_response(m) for m in messages], next_cursor=next_cursor
+    )
+
+
 @router.post("", response_model=DisputeResponse, status_code=status.HTTP_201_CREATED)
-async def open_dispute(
+def open_dispute(
     body: DisputeCreate,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
@@ -127,12 +233,13 @@ async def open_dispute(
     order.status = OrderStatus.disputed
     order.updated_at = datetime.utcnow()
 
-    db.add(AuditLog(
+    record_audit(
+        db,
         user_id=current_user.id,
         action="dispute_opened",
         entity_type="dispute",
         details=f"Dispute opened for order #{order.id}",
-    ))
+    )
     db.commit()
     db.refresh(dispute)
 
@@ -146,35 +253,17 @@ async def open_dispute(
 
 
 @router.post("/{dispute_id}/messages", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
-async def send_message(
+def send_message(
     dispute_id: int,
     body: MessageCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    dispute = db.query(Dispute).filter(Dispute.id == dispute_id).first()
-    if not dispute:
-        raise HTTPException(status_code=404, detail="Dispute not found")
-
-    is_participant = dispute.buyer_id == current_user.id or dispute.seller_id == current_user.id
-    if not is_participant and current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="Access denied")
-
-    if dispute.status in (DisputeStatus.resolved_buyer, DisputeStatus.resolved_seller, DisputeStatus.closed):
-        raise HTTPException(status_code=400, detail="This dispute has been resolved")
-
-    message = Message(
-        dispute_id=dispute.id,
-        sender_id=current_user.id,
-        content=body.content,
-    )
-    db.add(message)
-
-    if dispute.status == DisputeStatus.open:
-        dispute.status = DisputeStatus.under_review
-
+    dispute = get_accessible_dispute(db, dispute_id, current_user)
+    message = post_message(db, dispute, current_user, body.content)
     db.commit()
     db.refresh(message)
+    hub.notify(dispute.id)
 
     return MessageResponse(
         id=message.id,
@@ -184,3 +273,145 @@ async def send_message(
         content=message.content,
         created_at=message.created_at,
     )
+
+
+# How long a new socket may stay open before its auth frame arrives
+_SOCKET_AUTH_SECONDS = 10
+
+
+def _open_socket(token: str, dispute_id: int, after: Optional[int]) -> tuple[DisputeStatus, int]:
+    with ReadSessionLocal() as db:
+        user = authenticate_token(token, db)
+        dispute = get_accessible_dispute(db, dispute_id, user)
+        if after is None:
+            after = (
+                db.query(func.max(Message.id)).filter(Message.dispute_id == dispute_id).scalar() or 0
+            )
+        return dispute.status, after
+
+
+def _check_socket_token(token: str, dispute_id: int) -> None:
+    with ReadSessionLocal() as db:
+        user = authenticate_token(token, db)
+        get_accessible_dispute(db, dispute_id, user)
+
+
+def _auth_token(raw: str) -> Optional[str]:
+    try:
+        body = json.loads(raw)
+    except ValueError:
+        return None
+    if isinstance(body, dict) and body.get("type") == "auth" and isinstance(body.get("token"), str):
+        return body["token"]
+    return None
+
+
+def _socket_error(exc: HTTPException) -> dict:
+    return {"type": "error", "status": exc.status_code, "detail": exc.detail}
+
+
+def _changes_since(dispute_id: int, after: int) -> tuple[DisputeStatus, list[MessageResponse]]:
+    with ReadSessionLocal() as db:
+        dispute_status = db.query(Dispute.status).filter(Dispute.id == dispute_id).scalar()
+        messages = (
+            db.query(Message)
+            .options(joinedload(Message.sender))
+            .filter(Message.dispute_id == dispute_id, Message.id > after)
+            .order_by(Message.id)
+            .all()
+        )
+        return dispute_status, [build_message_response(m) for m in messages]
+
+
+def _post_from_socket(token: str, dispute_id: int, content: str) -> None:
+    with SessionLocal() as db:
+        user = authenticate_token(token, db)
+        dispute = get_accessible_dispute(db, dispute_id, user)
+        post_message(db, dispute, user, content)
+        db.commit()
+    hub.notify(dispute_id)
+
+
+async def _push_changes(
+    websocket: WebSocket, dispute_id: int, wakeup: asyncio.Event, dispute_status: DisputeStatus, after: int
+) -> None:
+    while True:
+        await wakeup.wait()
+        wakeup.clear()
+        current_status, messages = await run_in_threadpool(_changes_since, dispute_id, after)
+        for message in messages:
+            await websocket.send_json({"type": "message", "message": message.model_dump(mode="json")})
+            after = message.id
+        if current_status != dispute_status:
+            dispute_status = current_status
+            await websocket.send_json({"type": "status", "status": dispute_status.value})
+
+
+async def _receive_messages(websocket: WebSocket, token: str, dispute_id: int) -> None:
+    """Post incoming messages as the socket's user.
+
+    Every post re-checks the current token, so an expired one answers with a
+    401 error frame. The client then sends ``{"type": "auth", "token": ...}``
+    with a refreshed token and carries on over the same socket.
+    """
+    while True:
+        raw = await websocket.receive_text()
+        new_token = _auth_token(raw)
+        try:
+            if new_token is not None:
+                await run_in_threadpool(_check_socket_token, new_token, dispute_id)
+                token = new_token
+                continue
+            body = MessageCreate.model_validate(json.loads(raw))
+            await run_in_threadpool(_post_from_socket, token, dispute_id, body.content)
+        except (ValueError, ValidationError):
+            await websocket.send_json({"type": "error", "detail": "Invalid message"})
+        except HTTPException as exc:
+            await websocket.send_json(_socket_error(exc))
+
+
+@router.websocket("/{dispute_id}/ws")
+async def dispute_socket(
+    websocket: WebSocket,
+    dispute_id: int,
+    after: Optional[int] = Query(None, ge=0),
+):
+    """Live thread: pushes messages newer than ``after`` and accepts ``{"content": ...}``.
+
+    Browsers cannot set headers on a WebSocket, and a token in the query
+    string ends up in access logs, so the first frame must be
+    ``{"type": "auth", "token": <access token>}``. Sent messages are echoed
+    back like any other delta.
+    """
+    await websocket.accept()
+    try:
+        raw = await asyncio.wait_for(websocket.receive_text(), timeout=_SOCKET_AUTH_SECONDS)
+    except (asyncio.TimeoutError, WebSocketDisconnect):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    token = _auth_token(raw)
+    try:
+        if token is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Expected an auth frame")
+        dispute_status, after = await run_in_threadpool(_open_socket, token, dispute_id, after)
+    except HTTPException as exc:
+        await websocket.send_json(_socket_error(exc))
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    wakeup = hub.subscribe(dispute_id)
+    wakeup.set()
+    tasks = [
+        asyncio.create_task(_push_changes(websocket, dispute_id, wakeup, dispute_status, after)),
+        asyncio.create_task(_receive_messages(websocket, token, dispute_id)),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.unsubscribe(dispute_id, wakeup)
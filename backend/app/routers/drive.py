@@ -1,61 +1,90 @@
 import os
-import shutil
-import uuid
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, get_read_db
 from app.models.user import User, UserRole
 from app.models.drive import DriveFile
 from app.schemas.drive import DriveFileResponse
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_current_user_read
+from app.core.uploads import ReceivedFile, receive_file
 
 router = APIRouter()
 
 DRIVE_UPLOAD_DIR = os.path.join("data", "drive_uploads")
 os.makedirs(DRIVE_UPLOAD_DIR, exist_ok=True)
 
-def get_drive_user(current_user: User = Depends(get_current_user)):
+def _require_drive_access(current_user: User) -> User:
     if current_user.role not in [UserRole.seller, UserRole.admin]:
         raise HTTPException(status_code=403, detail="Drive access is restricted to sellers.")
     return current_user
 
-@router.post("/upload", response_model=DriveFileResponse)
-def upload_file(
-    file: UploadFile = File(...),
-    current_user: User = Depends(get_drive_user),
-    db: Session = Depends(get_db)
-):
-    if file.content_type != "application/pdf":
-        raise HTTPException(status_code=400, detail="Only PDF files are allowed")
-
-    ext = os.path.splitext(file.filename)[1] if file.filename else ""
-    safe_filename = f"{uuid.uuid4().hex}{ext}"
-    file_path = os.path.join(DRIVE_UPLOAD_DIR, safe_filename)
-
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+def get_drive_user(current_user: User = Depends(get_current_user)):
+    return _require_drive_access(current_user)
 
-    size = os.path.getsize(file_path)
+def get_drive_user_read(current_user: User = Depends(get_current_user_read)):
+    return _require_drive_access(current_user)
 
+def _record_upload(db: Session, seller_id: int, received: ReceivedFile) -> DriveFile:
     drive_file = DriveFile(
-        seller_id=current_user.id,
-        file_name=file.filename or "unnamed_file",
-        file_path=file_path,
-        content_type=file.content_type,
-        size=size
+        seller_id=seller_id,
+        file_name=received.file_name or "unnamed_file",
+        file_path=received.path,
+        content_type=received.content_type,
+        size=received.size,
+        checksum=received.sha256,
     )
     db.add(drive_file)
     db.commit()
     db.refresh(drive_file)
     return drive_file
 
-@router.get("", response_model=List[DriveFileResponse])
-def list_files(
+@router.post(
+    "/upload",
+    response_model=DriveFileResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["file"],
+                        "properties": {"file": {"type": "string", "format": "binary"}},
+                    }
+                }
+            },
+        }
+    },
+)
+async def upload_file(
+    request: Request,
     current_user: User = Depends(get_drive_user),
     db: Session = Depends(get_db)
+):
+    # Read the body ourselves rather than through UploadFile, which would
+    # spool the whole upload to a temp file before this handler runs
+    received = await receive_file(
+        request,
+        field="file",
+        dest_dir=DRIVE_UPLOAD_DIR,
+        max_size=settings.drive_max_upload_size,
+        allowed_types={"application/pdf"},
+    )
+    try:
+        return await run_in_threadpool(_record_upload, db, current_user.id, received)
+    except BaseException:
+        os.remove(received.path)
+        raise
+
+@router.get("", response_model=List[DriveFileResponse])
+def list_files(
+    current_user: User = Depends(get_drive_user_read),
+    db: Session = Depends(get_read_db)
 ):
     files = db.query(DriveFile).filter(DriveFile.seller_id == current_user.id).all()
     return files
@@ -63,8 +92,8 @@ def list_files(
 @router.get("/{file_id}/download")
 def download_file(
     file_id: int,
-    current_user: User = Depends(get_drive_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_drive_user_read),
+    db: Session = Depends(get_read_db)
 ):
     drive_file = db.query(DriveFile).filter(DriveFile.id == file_id, DriveFile.seller_id == current_user.id).first()
     if not drive_file:
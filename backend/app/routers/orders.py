@@ -5,10 +5,9 @@ from typing import Optional
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_seller, get_current_user
+from app.core.deps import get_current_seller, get_current_seller_read, get_current_user, get_current_user_read
 from app.core.email import send_order_confirmation, send_order_shipped_notification
-from app.database import get_db
-from app.models.audit import AuditLog
+from app.database import get_db, get_read_db
 from app.models.order import Order, OrderItem, OrderStatus, VALID_TRANSITIONS
 from app.models.user import User
 from app.schemas.order import (
@@ -18,9 +17,12 @@ from app.schemas.order import (
     OrderItemResponse,
     ShipOrderRequest,
 )
+from app.services.audit_service import record_audit
+from app.core.writer import run_write
 from app.services.order_service import (
+    cancel_and_refund_order,
     create_order,
-    release_escrow_to_seller,
+    mark_order_completed,
     validate_transition,
 )
 
@@ -56,10 +58,10 @@ def build_order_response(order: Order) -> OrderResponse:
 
 
 @router.get("", response_model=list[OrderResponse])
-async def list_my_orders(
+def list_my_orders(
     status_filter: Optional[str] = Query(None, alias="status"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     query = db.query(Order).filter(Order.buyer_id == current_user.id)
 
@@ -75,10 +77,10 @@ async def list_my_orders(
 
 
 @router.get("/seller", response_model=list[OrderResponse])
-async def list_seller_orders(
+def list_seller_orders(
     status_filter: Optional[str] = Query(None, alias="status"),
-    current_user: User = Depends(get_current_seller),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_seller_read),
+    db: Session = Depends(get_read_db),
 ):
     query = (
         db.query(Order)
@@ -99,10 +101,10 @@ async def list_seller_orders(
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
-async def get_order(
+def get_order(
     order_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     order = db.query(Order).filter(Order.id == order_id).first()
     if not order:
@@ -119,15 +121,14 @@ async def get_order(
 
 
 @router.post("", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
-async def place_order(
+def place_order(
     body: OrderCreate,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    order = create_order(db, current_user, body)
-    db.commit()
-    db.refresh(order)
+    order_id = run_write(db, lambda w: create_order(w, current_user, body).id)
+    order = db.query(Order).filter(Order.id == order_id).first()
 
     background_tasks.add_task(
         send_order_confirmation, current_user.email, order.id, order.total_amount
@@ -137,7 +138,7 @@ async def place_order(
 
 
 @router.put("/{order_id}/ship", response_model=OrderResponse)
-async def ship_order(
+def ship_order(
     order_id: int,
     body: ShipOrderRequest,
     background_tasks: BackgroundTasks,
@@ -158,13 +159,14 @@ async def ship_order(
     order.tracking_number = body.tracking_number
     order.updated_at = datetime.utcnow()
 
-    db.add(AuditLog(
+    record_audit(
+        db,
         user_id=current_user.id,
         action="order_shipped",
         entity_type="order",
         entity_id=order.id,
         details=f"Tracking: {body.tracking_number}",
-    ))
+    )
     db.commit()
     db.refresh(order)
 
@@ -176,7 +178,7 @@ async def ship_order(
 
 
 @router.put("/{order_id}/confirm-delivery", response_model=OrderResponse)
-async def confirm_delivery(
+def confirm_delivery(
     order_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -199,72 +201,25 @@ async def confirm_delivery(
 
 
 @router.put("/{order_id}/complete", response_model=OrderResponse)
-async def complete_order(
+def complete_order(
     order_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    order = db.query(Order).filter(Order.id == order_id).first()
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    if order.buyer_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Only the buyer can complete an order")
-
-    validate_transition(order.status, OrderStatus.completed)
-
-    order.status = OrderStatus.completed
-    order.updated_at = datetime.utcnow()
-
-    release_escrow_to_seller(db, order)
-
-    db.add(AuditLog(
-        user_id=current_user.id,
-        action="order_completed",
-        entity_type="order",
-        entity_id=order.id,
-    ))
-    db.commit()
-    db.refresh(order)
+    run_write(db, lambda w: mark_order_completed(w, order_id, current_user))
 
+    order = db.query(Order).filter(Order.id == order_id).first()
     return build_order_response(order)
 
 
 @router.put("/{order_id}/cancel", response_model=OrderResponse)
-async def cancel_order(
+def cancel_order(
     order_id: int,
     body: CancelOrderRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    order = db.query(Order).filter(Order.id == order_id).first()
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    is_buyer = order.buyer_id == current_user.id
-    is_seller = any(item.seller_id == current_user.id for item in order.items)
-    is_admin = current_user.role == "admin"
-
-    if not (is_buyer or is_seller or is_admin):
-        raise HTTPException(status_code=403, detail="Access denied")
-
-    validate_transition(order.status, OrderStatus.cancelled)
-
-    from app.services.order_service import process_refund
-    if order.status == OrderStatus.paid:
-        process_refund(db, order, order.total_amount, "Order cancelled", current_user.id)
-
-    order.status = OrderStatus.cancelled
-    order.updated_at = datetime.utcnow()
-
-    db.add(AuditLog(
-        user_id=current_user.id,
-        action="order_cancelled",
-        entity_type="order",
-        entity_id=order.id,
-        details=body.reason,
-    ))
-    db.commit()
-    db.refresh(order)
+    run_write(db, lambda w: cancel_and_refund_order(w, order_id, current_user, body.reason))
 
+    order = db.query(Order).filter(Order.id == order_id).first()
     return build_order_response(order)
@@ -5,8 +5,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.core.cache import LocalCache, invalidate
 from app.core.deps import get_current_seller, get_current_user
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.product import Product
 from app.models.user import User
 from app.schemas.product import (
@@ -18,6 +20,8 @@ from app.schemas.product import (
 
 router = APIRouter()
 
+product_cache = LocalCache("product", settings.product_cache_size, settings.product_cache_ttl)
+
 CATEGORIES = [
     "Electronics", "Accessories", "Clothing", "Food & Beverage",
     "Education", "Software", "Books", "Home & Garden", "Sports", "Other",
@@ -43,14 +47,15 @@ def build_product_response(product: Product) -> ProductResponse:
 
 
 @router.get("", response_model=ProductListResponse)
-async def list_products(
+def list_products(
     search: Optional[str] = Query(None, max_length=200),
     category: Optional[str] = Query(None, max_length=100),
+    seller_id: Optional[int] = Query(None),
     min_price: Optional[float] = Query(None, ge=0),
     max_price: Optional[float] = Query(None, ge=0),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     query = db.query(Product).filter(Product.is_active == True)
 
@@ -63,6 +68,9 @@ async def list_products(
     if category:
         query = query.filter(Product.category == category)
 
+    if seller_id is not None:
+        query = query.filter(Product.seller_id == seller_id)
+
     if min_price is not None:
         query = query.filter(Product.price >= min_price)
 
@@ -87,15 +95,25 @@ async def get_categories():
 
 
 @router.get("/{product_id}", response_model=ProductResponse)
-async def get_product(product_id: int, db: Session = Depends(get_db)):
+def get_product(product_id: int, db: Session = Depends(get_read_db)):
+    cached = product_cache.get(product_id)
+    if cached is not None:
+        return cached
+
+    # Taken before the read, so a row loaded ahead of a concurrent write
+    # is not cached once that write has evicted it
+    generation = product_cache.generation()
     product = db.query(Product).filter(Product.id == product_id).first()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return build_product_response(product)
+
+    response = build_product_response(product)
+    product_cache.set(product_id, response, generation)
+    return response
 
 
 @router.post("", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
-async def create_product(
+def create_product(
     body: ProductCreate,
     current_user: User = Depends(get_current_seller),
     db: Session = Depends(get_db),
@@ -118,7 +136,7 @@ async def create_product(
 
 
 @router.put("/{product_id}", response_model=ProductResponse)
-async def update_product(
+def update_product(
     product_id: int,
     body: ProductUpdate,
     current_user: User = Depends(get_current_seller),
@@ -146,13 +164,14 @@ async def update_product(
     if body.is_active is not None:
         product.is_active = body.is_active
 
+    invalidate(db, "product", product.id)
     db.commit()
     db.refresh(product)
     return build_product_response(product)
 
 
 @router.delete("/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_product(
+def delete_product(
     product_id: int,
     current_user: User = Depends(get_current_seller),
     db: Session = Depends(get_db),
@@ -165,4 +184,5 @@ async def delete_product(
         raise HTTPException(status_code=403, detail="You do not own this product")
 
     product.is_active = False
+    invalidate(db, "product", product.id)
     db.commit()
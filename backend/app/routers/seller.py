@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_current_seller_read
+from app.database import get_read_db
+from app.models.order import Order, OrderItem
+from app.models.payout import Payout
+from app.models.product import Product
+from app.models.rollup import SalesRollup
+from app.models.user import User
+from app.models.wallet import Wallet
+from app.schemas.common import StatusTotal
+from app.schemas.seller import DailySales, SellerDashboardResponse
+
+router = APIRouter()
+
+
+@router.get("/dashboard", response_model=SellerDashboardResponse)
+def seller_dashboard(
+    days: int = Query(30, ge=1, le=365),
+    current_user: User = Depends(get_current_seller_read),
+    db: Session = Depends(get_read_db),
+):
+    """Everything the seller dashboard header shows, as grouped aggregates."""
+    seller_id = current_user.id
+
+    wallet = db.query(Wallet.balance, Wallet.pending_balance).filter(Wallet.user_id == seller_id).first()
+
+    # Amounts are the seller's share of each order, not the order total
+    orders = {
+        order_status: StatusTotal(count=count, amount=round(amount or 0, 2))
+        for order_status, count, amount in db.query(
+            Order.status,
+            func.count(func.distinct(Order.id)),
+            func.sum(OrderItem.quantity * OrderItem.unit_price),
+        )
+        .join(OrderItem, OrderItem.order_id == Order.id)
+        .filter(OrderItem.seller_id == seller_id)
+        .group_by(Order.status)
+    }
+
+    payouts = {
+        payout_status: StatusTotal(count=count, amount=round(amount or 0, 2))
+        for payout_status, count, amount in db.query(
+            Payout.status, func.count(Payout.id), func.sum(Payout.amount)
+        )
+        .filter(Payout.seller_id == seller_id)
+        .group_by(Payout.status)
+    }
+
+    products = dict(
+        db.query(Product.is_active, func.count(Product.id))
+        .filter(Product.seller_id == seller_id)
+        .group_by(Product.is_active)
+        .all()
+    )
+
+    # Rollup days come from utcnow() timestamps
+    since = datetime.utcnow().date() - timedelta(days=days - 1)
+    recent_sales = [
+        DailySales(day=day, order_count=order_count, units=units, gmv=round(gmv, 2))
+        for day, order_count, units, gmv in db.query(
+            SalesRollup.day,
+            func.sum(SalesRollup.order_count),
+            func.sum(SalesRollup.units),
+            func.sum(SalesRollup.gmv),
+        )
+        .filter(SalesRollup.seller_id == seller_id, SalesRollup.day >= since)
+        .group_by(SalesRollup.day)
+        .order_by(SalesRollup.day)
+    ]
+
+    return SellerDashboardResponse(
+        balance=wallet.balance if wallet else 0.0,
+        pending_balance=wallet.pending_balance if wallet else 0.0,
+        total_orders=sum(o.count for o in orders.values()),
+        orders=orders,
+        payouts=payouts,
+        active_products=products.get(True, 0),
+        inactive_products=products.get(False, 0),
+        recent_sales=recent_sales,
+    )
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate
 from app.core.deps import get_current_user
 from app.core.security import get_password_hash, verify_password
-from app.database import get_db
-from app.models.user import User
+from app.database import get_db, get_read_db
+from app.models.user import User, UserRole
 from app.schemas.user import ChangePasswordRequest, UpdateProfileRequest, UserResponse
 
 router = APIRouter()
@@ -16,12 +17,15 @@ async def get_profile(current_user: User = Depends(get_current_user)):
 
 
 @router.put("/me", response_model=UserResponse)
-async def update_profile(
+def update_profile(
     body: UpdateProfileRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     if body.full_name is not None:
+        if body.full_name != current_user.full_name and current_user.role != UserRole.buyer:
+            # Product responses embed the seller's name
+            invalidate(db, "product")
         current_user.full_name = body.full_name
     if body.bio is not None:
         current_user.bio = body.bio
@@ -34,7 +38,7 @@ async def update_profile(
 
 
 @router.put("/me/password")
-async def change_password(
+def change_password(
     body: ChangePasswordRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -49,7 +53,7 @@ async def change_password(
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user_public(user_id: int, db: Session = Depends(get_db)):
+def get_user_public(user_id: int, db: Session = Depends(get_read_db)):
     user = db.query(User).filter(User.id == user_id, User.is_active == True).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
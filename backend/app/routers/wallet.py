@@ -3,8 +3,9 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user
-from app.database import get_db
+from app.core.deps import get_current_user, get_current_user_read
+from app.core.writer import run_write
+from app.database import get_db, get_read_db
 from app.models.user import User
 from app.models.wallet import Wallet, WalletTransaction
 from app.schemas.wallet import (
@@ -19,34 +20,36 @@ router = APIRouter()
 
 
 @router.get("", response_model=WalletResponse)
-async def get_wallet(
-    current_user: User = Depends(get_current_user),
+def get_wallet(
+    current_user: User = Depends(get_current_user_read),
     db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
 ):
-    wallet = get_or_create_wallet(db, current_user.id)
-    db.commit()
+    wallet = read_db.query(Wallet).filter(Wallet.user_id == current_user.id).first()
+    if wallet is None:
+        wallet = get_or_create_wallet(db, current_user.id)
+        db.commit()
     return wallet
 
 
 @router.post("/deposit", response_model=WalletResponse)
-async def add_funds(
+def add_funds(
     body: DepositRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    deposit_funds(db, current_user.id, body.amount, f"Deposit via {body.payment_method}")
-    db.commit()
+    run_write(db, lambda w: deposit_funds(w, current_user.id, body.amount, f"Deposit via {body.payment_method}"))
 
     wallet = db.query(Wallet).filter(Wallet.user_id == current_user.id).first()
     return wallet
 
 
 @router.get("/transactions", response_model=TransactionListResponse)
-async def get_transactions(
+def get_transactions(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     wallet = db.query(Wallet).filter(Wallet.user_id == current_user.id).first()
     if not wallet:
@@ -0,0 +1,21 @@
+from datetime import date
+from typing import List, Literal
+
+from pydantic import BaseModel
+
+
+class SalesPoint(BaseModel):
+    period: str
+    order_count: int
+    units: int
+    gmv: float
+    released_amount: float
+    refund_count: int
+    refund_amount: float
+
+
+class SalesSeriesResponse(BaseModel):
+    granularity: Literal["day", "week", "month"]
+    since: date
+    until: date
+    items: List[SalesPoint]
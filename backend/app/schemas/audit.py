@@ -0,0 +1,21 @@
+from typing import Optional, List
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class AuditLogResponse(BaseModel):
+    id: int
+    user_id: Optional[int]
+    action: str
+    entity_type: Optional[str]
+    entity_id: Optional[int]
+    details: Optional[str]
+    ip_address: Optional[str]
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class AuditLogListResponse(BaseModel):
+    items: List[AuditLogResponse]
+    next_cursor: Optional[str] = None
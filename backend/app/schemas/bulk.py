@@ -0,0 +1,26 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+BulkAction = Literal["freeze", "unfreeze", "verify", "wallet_adjust"]
+BulkOutcome = Literal["updated", "unchanged", "not_found", "rejected"]
+
+
+class BulkUserActionRequest(BaseModel):
+    action: BulkAction
+    user_ids: List[int] = Field(..., min_length=1)
+    amount: Optional[float] = Field(None, description="wallet_adjust only: positive to credit, negative to debit")
+    description: Optional[str] = Field(None, min_length=5, max_length=500)
+
+
+class BulkUserResult(BaseModel):
+    user_id: int
+    outcome: BulkOutcome
+    detail: Optional[str] = None
+
+
+class BulkUserActionResponse(BaseModel):
+    action: BulkAction
+    requested: int
+    updated: int
+    results: List[BulkUserResult]
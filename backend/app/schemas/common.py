@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class StatusTotal(BaseModel):
+    """Row count and amount for one status, as returned by grouped totals."""
+
+    count: int
+    amount: float
@@ -43,6 +43,33 @@ class DisputeResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class MessageListResponse(BaseModel):
+    items: List[MessageResponse]
+    next_cursor: Optional[str] = None
+
+
+class DisputeSummaryResponse(BaseModel):
+    id: int
+    order_id: int
+    buyer_id: int
+    seller_id: int
+    buyer_username: Optional[str] = None
+    seller_username: Optional[str] = None
+    reason: str
+    status: DisputeStatus
+    admin_notes: Optional[str]
+    resolution: Optional[str]
+    created_at: datetime
+    resolved_at: Optional[datetime]
+    message_count: int = 0
+    last_message: Optional[MessageResponse] = None
+
+
+class DisputeListResponse(BaseModel):
+    items: List[DisputeSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
 class ResolveDisputeRequest(BaseModel):
     resolution: str = Field(..., min_length=10, max_length=2000)
     refund_buyer: bool
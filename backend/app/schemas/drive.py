@@ -8,6 +8,7 @@ class DriveFileResponse(BaseModel):
     file_name: str
     content_type: Optional[str]
     size: int
+    checksum: Optional[str] = None
     created_at: datetime
 
     class Config:
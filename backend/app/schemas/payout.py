@@ -1,8 +1,9 @@
-from typing import Optional, List
+from typing import Dict, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
-from app.models.payout import PayoutStatus
+from app.models.payout import PayoutStatus, SettlementRunStatus
+from app.schemas.common import StatusTotal
 
 
 class PayoutRequest(BaseModel):
@@ -22,6 +23,7 @@ class PayoutResponse(BaseModel):
     created_at: datetime
     processed_at: Optional[datetime]
     completed_at: Optional[datetime]
+    settlement_run_id: Optional[int] = None
 
     model_config = {"from_attributes": True}
 
@@ -29,3 +31,27 @@ class PayoutResponse(BaseModel):
 class PayoutListResponse(BaseModel):
     items: List[PayoutResponse]
     total: int
+    next_cursor: Optional[str] = None
+    totals: Dict[PayoutStatus, StatusTotal] = {}
+
+
+class SettlementRunRequest(BaseModel):
+    method: Optional[str] = Field(None, pattern=r"^(bank_transfer|paypal|crypto)$")
+
+
+class SettlementRunResponse(BaseModel):
+    id: int
+    method: str
+    status: SettlementRunStatus
+    payout_count: int
+    total_amount: float
+    error: Optional[str]
+    created_at: datetime
+    completed_at: Optional[datetime]
+
+    model_config = {"from_attributes": True}
+
+
+class SettlementRunListResponse(BaseModel):
+    items: List[SettlementRunResponse]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,26 @@
+from datetime import date
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from app.models.order import OrderStatus
+from app.models.payout import PayoutStatus
+from app.schemas.common import StatusTotal
+
+
+class DailySales(BaseModel):
+    day: date
+    order_count: int
+    units: int
+    gmv: float
+
+
+class SellerDashboardResponse(BaseModel):
+    balance: float
+    pending_balance: float
+    total_orders: int
+    orders: Dict[OrderStatus, StatusTotal]
+    payouts: Dict[PayoutStatus, StatusTotal]
+    active_products: int
+    inactive_products: int
+    recent_sales: List[DailySales]
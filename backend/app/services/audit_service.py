@@ -0,0 +1,208 @@
+import json
+import logging
+import os
+import queue
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import bindparam, delete, event, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.audit import AuditLog
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows dev machines run a single worker
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_audit_events"
+
+_queue: queue.Queue = queue.Queue(maxsize=settings.audit_queue_size)
+
+
+def record_audit(
+    db: Session,
+    *,
+    user_id: Optional[int],
+    action: str,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[int] = None,
+    details: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    sync: bool = False,
+) -> None:
+    """Record an audit event as part of the caller's unit of work.
+
+    Synchronous events are inserted in the caller's transaction. Others are
+    held on the session and handed to the background writer only once that
+    transaction commits, so a rolled-back request leaves no audit trail.
+    """
+    event_row = {
+        "user_id": user_id,
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "details": details,
+        "ip_address": ip_address,
+        "created_at": datetime.utcnow(),
+    }
+    if sync or not settings.audit_async_enabled or action in settings.audit_sync_actions:
+        db.add(AuditLog(**event_row))
+        return
+    db.info.setdefault(_PENDING_KEY, []).append(event_row)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _enqueue_committed_events(session: Session) -> None:
+    events = session.info.pop(_PENDING_KEY, None)
+    if not events:
+        return
+
+    overflow = []
+    for event_row in events:
+        try:
+            _queue.put_nowait(event_row)
+        except queue.Full:
+            overflow.append(event_row)
+
+    if overflow:
+        logger.warning(f"Audit queue full; writing {len(overflow)} event(s) inline")
+        _write_batch(overflow)
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _discard_rolled_back_events(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _write_batch(rows: list[dict]) -> None:
+    try:
+        with SessionLocal() as db:
+            db.execute(insert(AuditLog), rows)
+            db.commit()
+    except Exception as e:
+        logger.error(f"Audit flush of {len(rows)} event(s) failed, spooling to disk: {e}")
+        _spool(rows)
+
+
+def _spool(rows: list[dict]) -> None:
+    spool_dir = os.path.dirname(settings.audit_spool_path)
+    if spool_dir:
+        os.makedirs(spool_dir, exist_ok=True)
+    while True:
+        with open(settings.audit_spool_path, "a", encoding="utf-8") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                # The leader may have taken the file for replay since we
+                # opened it; appending to that copy would lose the rows
+                try:
+                    current = os.stat(settings.audit_spool_path).st_ino
+                except FileNotFoundError:
+                    current = None
+                if current != os.fstat(f.fileno()).st_ino:
+                    continue
+            for row in rows:
+                f.write(json.dumps({**row, "created_at": row["created_at"].isoformat()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            return
+
+
+def replay_spool() -> int:
+    """Insert events spooled by processes that could not reach the database.
+
+    Called by the leader only. The spool is renamed before it is read, so
+    workers still spooling start a fresh file and nothing appended during
+    the replay is lost. A file left by a replay that died part way is picked
+    up first.
+    """
+    path = settings.audit_spool_path
+    replaying = f"{path}.replaying"
+    leftover = os.path.exists(replaying)
+    if not leftover:
+        try:
+            os.replace(path, replaying)
+        except FileNotFoundError:
+            return 0
+
+    with open(replaying, encoding="utf-8") as f:
+        if fcntl is not None:
+            # Wait out a writer that opened the file just before the rename
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        rows = [json.loads(line) for line in f if line.strip()]
+    for row in rows:
+        row["created_at"] = datetime.fromisoformat(row["created_at"])
+
+    if rows:
+        with SessionLocal() as db:
+            db.execute(insert(AuditLog), rows)
+            db.commit()
+    os.remove(replaying)
+    logger.info(f"Replayed {len(rows)} spooled audit event(s)")
+    return len(rows) + (replay_spool() if leftover else 0)
+
+
+def flush() -> int:
+    """Drain the queue into batched multi-row inserts. Returns rows written."""
+    written = 0
+    while True:
+        batch = []
+        while len(batch) < settings.audit_batch_size:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return written
+        _write_batch(batch)
+        written += len(batch)
+
+
+def archive_old_audit_logs() -> int:
+    """Move audit rows older than ``audit_retention_days`` into monthly archive tables.
+
+    Works in chunks of ``audit_archive_chunk_size`` rows, one transaction each,
+    so the write lock is never held for long. Returns the number of rows moved.
+    """
+    if settings.audit_retention_days <= 0:
+        return 0
+
+    cutoff = datetime.utcnow() - timedelta(days=settings.audit_retention_days)
+    month = func.strftime("%Y%m", AuditLog.created_at)
+    moved = 0
+
+    while True:
+        with SessionLocal() as db:
+            rows = db.execute(
+                select(AuditLog.id, month)
+                .where(AuditLog.created_at < cutoff)
+                .order_by(AuditLog.id)
+                .limit(settings.audit_archive_chunk_size)
+            ).all()
+            if not rows:
+                break
+
+            ids_by_month: dict[str, list[int]] = defaultdict(list)
+            for row_id, row_month in rows:
+                ids_by_month[row_month].append(row_id)
+
+            for row_month, ids in ids_by_month.items():
+                archive = f"audit_logs_archive_{row_month}"
+                db.execute(text(f'CREATE TABLE IF NOT EXISTS "{archive}" AS SELECT * FROM audit_logs WHERE 0'))
+                db.execute(
+                    text(f'INSERT INTO "{archive}" SELECT * FROM audit_logs WHERE id IN :ids')
+                    .bindparams(bindparam("ids", expanding=True)),
+                    {"ids": ids},
+                )
+                db.execute(delete(AuditLog).where(AuditLog.id.in_(ids)))
+            db.commit()
+            moved += len(rows)
+
+    if moved:
+        logger.info(f"Archived {moved} audit log row(s) older than {cutoff:%Y-%m-%d}")
+    return moved
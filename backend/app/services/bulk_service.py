@@ -0,0 +1,164 @@
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.writer import run_write
+from app.database import SessionLocal
+from app.models.audit import AuditLog
+from app.models.user import User, UserRole
+from app.models.wallet import TransactionType, Wallet, WalletTransaction
+from app.schemas.bulk import BulkAction, BulkUserResult
+
+logger = logging.getLogger(__name__)
+
+_AUDIT_ACTIONS = {
+    "freeze": "account_frozen",
+    "unfreeze": "account_unfrozen",
+    "verify": "user_verified",
+    "wallet_adjust": "wallet_adjusted",
+}
+
+
+def _set_flag(w: Session, ids: list[int], **values) -> set[int]:
+    """Flip flags on the users that need it; returns the ids actually changed."""
+    changed = [getattr(User, name) != value for name, value in values.items()]
+    rows = w.execute(
+        update(User)
+        .where(User.id.in_(ids), *changed)
+        .values(updated_at=datetime.utcnow(), **values)
+        .returning(User.id)
+        .execution_options(synchronize_session=False)
+    )
+    return {user_id for (user_id,) in rows}
+
+
+def _adjust_wallets(w: Session, ids: list[int], amount: float, description: str) -> dict[int, float]:
+    """Apply ``amount`` to every wallet it would not take negative; returns new balances by user."""
+    now = datetime.utcnow()
+    w.execute(
+        sqlite_insert(Wallet)
+        .values([
+            {"user_id": user_id, "balance": 0.0, "pending_balance": 0.0, "created_at": now, "updated_at": now}
+            for user_id in ids
+        ])
+        .on_conflict_do_nothing(index_elements=["user_id"])
+    )
+    new_balance = func.round(Wallet.balance + amount, 2)
+    rows = w.execute(
+        update(Wallet)
+        .where(Wallet.user_id.in_(ids), new_balance >= 0)
+        .values(balance=new_balance, updated_at=now)
+        .returning(Wallet.id, Wallet.user_id, Wallet.balance)
+        .execution_options(synchronize_session=False)
+    ).all()
+    if rows:
+        w.execute(insert(WalletTransaction), [
+            {
+                "wallet_id": wallet_id,
+                "user_id": user_id,
+                "amount": amount,
+                "transaction_type": TransactionType.admin_adjustment,
+                "description": description,
+                "balance_after": balance,
+                "created_at": now,
+            }
+            for wallet_id, user_id, balance in rows
+        ])
+    return {user_id: balance for _, user_id, balance in rows}
+
+
+def _apply_chunk(
+    w: Session,
+    admin_id: int,
+    action: BulkAction,
+    ids: list[int],
+    amount: Optional[float],
+    description: Optional[str],
+) -> list[BulkUserResult]:
+    roles = dict(w.execute(select(User.id, User.role).where(User.id.in_(ids))).all())
+
+    results: dict[int, BulkUserResult] = {}
+    eligible = []
+    for user_id in ids:
+        role = roles.get(user_id)
+        if role is None:
+            results[user_id] = BulkUserResult(user_id=user_id, outcome="not_found")
+        elif action == "freeze" and role == UserRole.admin:
+            results[user_id] = BulkUserResult(
+                user_id=user_id, outcome="rejected", detail="Cannot freeze administrator accounts"
+            )
+        else:
+            eligible.append(user_id)
+
+    details: dict[int, Optional[str]] = {}
+    if eligible:
+        if action == "freeze":
+            changed = _set_flag(w, eligible, is_frozen=True)
+        elif action == "unfreeze":
+            changed = _set_flag(w, eligible, is_frozen=False)
+        elif action == "verify":
+            changed = _set_flag(w, eligible, is_verified=True)
+        else:
+            balances = _adjust_wallets(w, eligible, amount, description)
+            changed = set(balances)
+            details = {user_id: f"${amount:+.2f} — {description}" for user_id in changed}
+
+        for user_id in eligible:
+            if user_id in changed:
+                results[user_id] = BulkUserResult(user_id=user_id, outcome="updated")
+            elif action == "wallet_adjust":
+                results[user_id] = BulkUserResult(
+                    user_id=user_id, outcome="rejected", detail="Adjustment would result in a negative balance"
+                )
+            else:
+                results[user_id] = BulkUserResult(user_id=user_id, outcome="unchanged")
+
+        if changed:
+            now = datetime.utcnow()
+            w.execute(insert(AuditLog), [
+                {
+                    "user_id": admin_id,
+                    "action": _AUDIT_ACTIONS[action],
+                    "entity_type": "user",
+                    "entity_id": user_id,
+                    "details": details.get(user_id),
+                    "created_at": now,
+                }
+                for user_id in sorted(changed)
+            ])
+
+    return [results[user_id] for user_id in ids]
+
+
+def apply_bulk_action(
+    admin_id: int,
+    action: BulkAction,
+    user_ids: list[int],
+    amount: Optional[float] = None,
+    description: Optional[str] = None,
+) -> list[BulkUserResult]:
+    """Apply one moderation action to many users with set-based statements.
+
+    Ids are processed ``bulk_action_chunk_size`` at a time, each chunk in its
+    own write transaction with its audit rows, so a large request never holds
+    the write lock for long and a failure leaves earlier chunks applied.
+    Results come back in request order, one per distinct id.
+    """
+    ids = list(dict.fromkeys(user_ids))
+    results: list[BulkUserResult] = []
+    size = settings.bulk_action_chunk_size
+    for start in range(0, len(ids), size):
+        chunk = ids[start:start + size]
+        with SessionLocal() as db:
+            results.extend(run_write(
+                db, lambda w: _apply_chunk(w, admin_id, action, chunk, amount, description)
+            ))
+
+    updated = sum(1 for r in results if r.outcome == "updated")
+    logger.info(f"Bulk {action} by admin #{admin_id}: {updated}/{len(ids)} user(s) updated")
+    return results
@@ -0,0 +1,83 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.cache import invalidate
+from app.core.realtime import DISPUTE_NAMESPACE
+from app.models.dispute import Dispute, DisputeStatus, Message
+from app.models.order import OrderStatus
+from app.models.user import User
+from app.services.audit_service import record_audit
+from app.services.order_service import process_refund, release_escrow_to_seller
+
+RESOLVED_STATUSES = (DisputeStatus.resolved_buyer, DisputeStatus.resolved_seller, DisputeStatus.closed)
+
+
+def post_message(db: Session, dispute: Dispute, sender: User, content: str) -> Message:
+    if dispute.status in RESOLVED_STATUSES:
+        raise HTTPException(status_code=400, detail="This dispute has been resolved")
+
+    message = Message(dispute_id=dispute.id, sender_id=sender.id, content=content)
+    db.add(message)
+
+    if dispute.status == DisputeStatus.open:
+        dispute.status = DisputeStatus.under_review
+
+    touch_dispute(db, dispute.id)
+    db.flush()
+    return message
+
+
+def touch_dispute(db: Session, dispute_id: int) -> None:
+    """Tell live dispute sockets in every worker to pick up the change once committed."""
+    invalidate(db, DISPUTE_NAMESPACE, dispute_id)
+
+
+def resolve_dispute(
+    db: Session,
+    dispute_id: int,
+    admin_id: int,
+    resolution: str,
+    admin_notes: Optional[str],
+    refund_buyer: bool,
+) -> None:
+    """Refund the buyer or release escrow to the seller, and close the dispute.
+
+    Moves money, so callers run it through ``run_write``.
+    """
+    dispute = db.query(Dispute).filter(Dispute.id == dispute_id).first()
+    if not dispute:
+        raise HTTPException(status_code=404, detail="Dispute not found")
+
+    if dispute.status in (DisputeStatus.resolved_buyer, DisputeStatus.resolved_seller):
+        raise HTTPException(status_code=400, detail="This dispute is already resolved")
+
+    order = dispute.order
+    now = datetime.utcnow()
+
+    if refund_buyer:
+        process_refund(db, order, order.total_amount, resolution, admin_id)
+        order.status = OrderStatus.refunded
+        dispute.status = DisputeStatus.resolved_buyer
+    else:
+        release_escrow_to_seller(db, order)
+        order.status = OrderStatus.completed
+        dispute.status = DisputeStatus.resolved_seller
+
+    order.updated_at = now
+    dispute.resolution = resolution
+    dispute.admin_notes = admin_notes
+    dispute.resolved_by_id = admin_id
+    dispute.resolved_at = now
+
+    record_audit(
+        db,
+        user_id=admin_id,
+        action="dispute_resolved",
+        entity_type="dispute",
+        entity_id=dispute.id,
+        details=f"refund_buyer={refund_buyer}",
+    )
+    touch_dispute(db, dispute.id)
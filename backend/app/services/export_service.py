@@ -0,0 +1,148 @@
+import csv
+import enum
+import io
+import json
+from datetime import datetime
+from typing import Iterator, Literal, Optional, Sequence
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session, aliased
+
+from app.config import settings
+from app.database import ReadSessionLocal
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.product import Product
+from app.models.user import User, UserRole
+from app.models.wallet import Wallet
+
+ExportFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+ORDER_COLUMNS = [
+    "order_id", "created_at", "status", "buyer_id", "buyer_username", "buyer_email",
+    "order_total", "shipping_address", "tracking_number",
+    "item_id", "product_id", "product_title", "seller_id", "seller_username",
+    "quantity", "unit_price", "line_total",
+]
+
+USER_COLUMNS = [
+    "user_id", "created_at", "email", "username", "full_name", "role",
+    "is_active", "is_verified", "is_frozen", "wallet_balance", "wallet_pending",
+]
+
+
+def order_id_range(db: Session, since: Optional[datetime], until: Optional[datetime]) -> tuple[int, int]:
+    """Smallest and largest order id placed in ``[since, until)``, off the created_at index."""
+    stmt = select(func.min(Order.id), func.max(Order.id))
+    if since:
+        stmt = stmt.where(Order.created_at >= since)
+    if until:
+        stmt = stmt.where(Order.created_at < until)
+    low, high = db.execute(stmt).one()
+    return (low, high) if low is not None else (0, -1)
+
+
+def order_rows(
+    id_range: tuple[int, int],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    status: Optional[OrderStatus] = None,
+) -> Select:
+    """One row per order item, with the order and both parties joined in.
+
+    Walks order_items in order_id order so SQLite can stream straight off
+    its index; sorting on orders.created_at would make it sort the whole
+    result in a temp b-tree before returning the first row. ``id_range``
+    bounds that walk to the orders in the date window.
+    """
+    buyer = aliased(User)
+    seller = aliased(User)
+    stmt = (
+        select(
+            Order.id, Order.created_at, Order.status, Order.buyer_id, buyer.username, buyer.email,
+            Order.total_amount, Order.shipping_address, Order.tracking_number,
+            OrderItem.id, OrderItem.product_id, Product.title, OrderItem.seller_id, seller.username,
+            OrderItem.quantity, OrderItem.unit_price,
+            (OrderItem.quantity * OrderItem.unit_price).label("line_total"),
+        )
+        .select_from(OrderItem)
+        .join(Order, Order.id == OrderItem.order_id)
+        .join(buyer, buyer.id == Order.buyer_id)
+        .join(seller, seller.id == OrderItem.seller_id)
+        .join(Product, Product.id == OrderItem.product_id)
+        .where(OrderItem.order_id.between(*id_range))
+        .order_by(OrderItem.order_id, OrderItem.id)
+    )
+    if since:
+        stmt = stmt.where(Order.created_at >= since)
+    if until:
+        stmt = stmt.where(Order.created_at < until)
+    if status:
+        stmt = stmt.where(Order.status == status)
+    return stmt
+
+
+def user_rows(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    role: Optional[UserRole] = None,
+    frozen: Optional[bool] = None,
+) -> Select:
+    stmt = (
+        select(
+            User.id, User.created_at, User.email, User.username, User.full_name, User.role,
+            User.is_active, User.is_verified, User.is_frozen, Wallet.balance, Wallet.pending_balance,
+        )
+        .outerjoin(Wallet, Wallet.user_id == User.id)
+        .order_by(User.created_at, User.id)
+    )
+    if since:
+        stmt = stmt.where(User.created_at >= since)
+    if until:
+        stmt = stmt.where(User.created_at < until)
+    if role:
+        stmt = stmt.where(User.role == role)
+    if frozen is not None:
+        stmt = stmt.where(User.is_frozen == frozen)
+    return stmt
+
+
+def _value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, float):
+        return round(value, 2)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _encode(fmt: ExportFormat, columns: Sequence[str], rows: Sequence) -> str:
+    buffer = io.StringIO()
+    if fmt == "csv":
+        csv.writer(buffer).writerows([[_value(v) for v in row] for row in rows])
+    else:
+        for row in rows:
+            buffer.write(json.dumps(dict(zip(columns, map(_value, row)))))
+            buffer.write("\n")
+    return buffer.getvalue()
+
+
+def stream_export(stmt: Select, columns: Sequence[str], fmt: ExportFormat) -> Iterator[str]:
+    """Encode ``stmt`` batch by batch as it is read.
+
+    Opens its own read session, since the response body is produced after the
+    request's dependencies have been torn down. Rows come off a server-side
+    cursor ``export_batch_size`` at a time, so memory stays flat however large
+    the export, and the whole file reads from one consistent snapshot.
+    """
+    if fmt == "csv":
+        header = io.StringIO()
+        csv.writer(header).writerow(columns)
+        yield header.getvalue()
+
+    with ReadSessionLocal() as db:
+        result = db.execute(stmt.execution_options(yield_per=settings.export_batch_size))
+        for batch in result.partitions():
+            yield _encode(fmt, columns, batch)
@@ -5,14 +5,16 @@ from typing import List
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate
 from app.models.escrow import Escrow, EscrowStatus
 from app.models.order import Order, OrderItem, OrderStatus, VALID_TRANSITIONS
 from app.models.product import Product
 from app.models.refund import Refund, RefundStatus, RefundType
 from app.models.user import User
-from app.models.audit import AuditLog
 from app.models.wallet import Wallet
 from app.schemas.order import OrderCreate
+from app.services import rollup_service
+from app.services.audit_service import record_audit
 from app.services.wallet_service import (
     credit_seller_pending,
     deduct_for_purchase,
@@ -101,6 +103,13 @@ def create_order(db: Session, buyer: User, order_data: OrderCreate) -> Order:
         )
         db.add(item)
         product.quantity -= qty
+        invalidate(db, "product", product.id)
+
+    rollup_service.record_sale(
+        db,
+        order.created_at,
+        rollup_service.slice_items((p.seller_id, p.category, qty, p.price) for p, qty in validated_items),
+    )
 
     # Deduct from buyer's wallet
     deduct_for_purchase(db, buyer.id, total_amount, order.id)
@@ -119,13 +128,14 @@ def create_order(db: Session, buyer: User, order_data: OrderCreate) -> Order:
     order.status = OrderStatus.paid
     order.updated_at = datetime.utcnow()
 
-    db.add(AuditLog(
+    record_audit(
+        db,
         user_id=buyer.id,
         action="order_placed",
         entity_type="order",
         entity_id=order.id,
         details=f"Order placed for ${total_amount:.2f}",
-    ))
+    )
 
     return order
 
@@ -145,6 +155,63 @@ def release_escrow_to_seller(db: Session, order: Order) -> None:
 
     escrow.status = EscrowStatus.released
     escrow.released_at = datetime.utcnow()
+    rollup_service.record_release(db, order, escrow.released_at)
+
+
+def mark_order_completed(db: Session, order_id: int, buyer: User) -> Order:
+    order = db.query(Order).filter(Order.id == order_id).first()
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    if order.buyer_id != buyer.id:
+        raise HTTPException(status_code=403, detail="Only the buyer can complete an order")
+
+    validate_transition(order.status, OrderStatus.completed)
+
+    order.status = OrderStatus.completed
+    order.updated_at = datetime.utcnow()
+
+    release_escrow_to_seller(db, order)
+
+    record_audit(
+        db,
+        user_id=buyer.id,
+        action="order_completed",
+        entity_type="order",
+        entity_id=order.id,
+    )
+    return order
+
+
+def cancel_and_refund_order(db: Session, order_id: int, actor: User, reason: str | None) -> Order:
+    order = db.query(Order).filter(Order.id == order_id).first()
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    is_buyer = order.buyer_id == actor.id
+    is_seller = any(item.seller_id == actor.id for item in order.items)
+    is_admin = actor.role == "admin"
+
+    if not (is_buyer or is_seller or is_admin):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    validate_transition(order.status, OrderStatus.cancelled)
+
+    if order.status == OrderStatus.paid:
+        process_refund(db, order, order.total_amount, "Order cancelled", actor.id)
+
+    order.status = OrderStatus.cancelled
+    order.updated_at = datetime.utcnow()
+
+    record_audit(
+        db,
+        user_id=actor.id,
+        action="order_cancelled",
+        entity_type="order",
+        entity_id=order.id,
+        details=reason,
+    )
+    return order
 
 
 def process_refund(db: Session, order: Order, amount: float, reason: str, initiated_by_id: int) -> Refund:
@@ -166,6 +233,7 @@ def process_refund(db: Session, order: Order, amount: float, reason: str, initia
     db.add(refund)
 
     refund_to_buyer(db, order.buyer_id, amount, order.id)
+    rollup_service.record_refund(db, order, amount, refund.processed_at)
 
     if refund_type == RefundType.full:
         escrow.status = EscrowStatus.refunded
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import secrets
+import time
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core import jobs
+from app.core.email import send_payout_notification
+from app.core.writer import run_write
+from app.database import SessionLocal
+from app.models.job import Job, JobStatus
+from app.models.payout import Payout, PayoutStatus
+from app.models.wallet import Wallet
+from app.services.wallet_service import process_payout_deduction, reverse_payout_deduction
+
+logger = logging.getLogger(__name__)
+
+PAYOUT_JOB = "payout"
+
+
+def create_payout(db: Session, seller_id: int, amount: float, method: str, notes: str | None) -> Payout:
+    wallet = db.query(Wallet).filter(Wallet.user_id == seller_id).first()
+    if not wallet or wallet.pending_balance < amount:
+        available = wallet.pending_balance if wallet else 0
+        raise HTTPException(
+            status_code=400,
+            detail=f"Insufficient pending balance. Available: ${available:.2f}",
+        )
+
+    # In batch mode the payout waits, funds already deducted, for the next settlement run.
+    batched = settings.payout_settlement_mode == "batch"
+    payout = Payout(
+        seller_id=seller_id,
+        amount=amount,
+        status=PayoutStatus.pending if batched else PayoutStatus.processing,
+        method=method,
+        notes=notes,
+        processed_at=None if batched else datetime.utcnow(),
+    )
+    db.add(payout)
+    db.flush()
+
+    process_payout_deduction(db, seller_id, amount, payout.id)
+    if not batched:
+        enqueue_payout(db, payout.id)
+    return payout
+
+
+def enqueue_payout(db: Session, payout_id: int) -> Job:
+    return jobs.enqueue(db, PAYOUT_JOB, {"payout_id": payout_id}, ref=str(payout_id))
+
+
+def process_payout(payload: dict) -> None:
+    """Job handler: settle a processing payout with the provider."""
+    payout_id = payload["payout_id"]
+    time.sleep(settings.payout_processing_delay)  # Simulate the provider round trip
+
+    with SessionLocal() as db:
+        payout = db.query(Payout).filter(Payout.id == payout_id).first()
+        if not payout or payout.status != PayoutStatus.processing:
+            return
+        payout.status = PayoutStatus.completed
+        payout.completed_at = datetime.utcnow()
+        payout.reference = f"PAY-{secrets.token_hex(8).upper()}"
+        db.commit()
+        email, amount = payout.seller.email, payout.amount
+        logger.info(f"Payout #{payout_id} completed. Ref: {payout.reference}")
+
+    asyncio.run(send_payout_notification(email, amount, "completed"))
+
+
+def fail_payout(payload: dict, error: str) -> None:
+    """Give-up hook: mark the payout failed and return the funds to pending."""
+    payout_id = payload["payout_id"]
+
+    def unit(w: Session) -> tuple[str, float] | None:
+        payout = w.query(Payout).filter(Payout.id == payout_id).first()
+        if not payout or payout.status != PayoutStatus.processing:
+            return None
+        payout.status = PayoutStatus.failed
+        reverse_payout_deduction(w, payout.seller_id, payout.amount, payout.id)
+        return payout.seller.email, payout.amount
+
+    with SessionLocal() as db:
+        reversed_payout = run_write(db, unit)
+    if reversed_payout is None:
+        return
+    logger.error(f"Payout #{payout_id} failed and was reversed: {error}")
+    asyncio.run(send_payout_notification(*reversed_payout, "failed"))
+
+
+def recover_stuck_payouts() -> int:
+    """Re-enqueue processing payouts that have no live job, e.g. from before a crash.
+
+    Payouts attached to a settlement run are owned by that run's job.
+    """
+    with SessionLocal() as db:
+        live = {
+            ref
+            for (ref,) in db.query(Job.ref).filter(
+                Job.kind == PAYOUT_JOB,
+                Job.status.in_([JobStatus.queued, JobStatus.running]),
+            )
+        }
+        stuck = [
+            payout_id
+            for (payout_id,) in db.query(Payout.id).filter(
+                Payout.status == PayoutStatus.processing,
+                Payout.settlement_run_id.is_(None),
+            )
+            if str(payout_id) not in live
+        ]
+        for payout_id in stuck:
+            enqueue_payout(db, payout_id)
+        db.commit()
+    if stuck:
+        logger.warning(f"Re-queued {len(stuck)} payout(s) stuck in processing")
+    return len(stuck)
+
+
+jobs.register_handler(PAYOUT_JOB, process_payout, give_up=fail_payout)
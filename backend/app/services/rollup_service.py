@@ -0,0 +1,162 @@
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.models.order import Order
+from app.models.rollup import SalesRollup
+
+# (seller_id, category) -> (units, amount)
+Slices = dict[tuple[int, str], tuple[int, float]]
+
+_MEASURES = ("order_count", "units", "gmv", "released_amount", "refund_count", "refund_amount")
+
+
+def slice_items(items: Iterable[tuple[int, Optional[str], int, float]]) -> Slices:
+    """Group ``(seller_id, category, quantity, unit_price)`` lines by seller and category."""
+    slices: Slices = {}
+    for seller_id, category, quantity, unit_price in items:
+        key = (seller_id, category or "")
+        units, amount = slices.get(key, (0, 0.0))
+        slices[key] = (units + quantity, amount + quantity * unit_price)
+    return slices
+
+
+def _order_slices(order: Order) -> Slices:
+    return slice_items(
+        (item.seller_id, item.product.category if item.product else None, item.quantity, item.unit_price)
+        for item in order.items
+    )
+
+
+def _add(db: Session, day: date, slices: Slices, counted: Optional[str] = None, **measures) -> None:
+    """Upsert ``measures`` into every slice.
+
+    ``counted`` names a count ("order_count" or "refund_count") to book once,
+    on the first category. Orders hold a single seller's items, so that
+    slice also counts the order once per seller and platform-wide.
+    """
+    first = min(slices, key=lambda key: key[1], default=None)
+    for key, (units, amount) in slices.items():
+        seller_id, category = key
+        values = {name: 0 for name in _MEASURES}
+        for name, measure in measures.items():
+            values[name] = round(measure(units, amount), 2)
+        if counted:
+            values[counted] = int(key == first)
+        stmt = insert(SalesRollup).values(day=day, seller_id=seller_id, category=category, **values)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["day", "seller_id", "category"],
+            set_={name: getattr(SalesRollup, name) + stmt.excluded[name] for name in _MEASURES},
+        ))
+
+
+def record_sale(db: Session, placed_at: datetime, slices: Slices) -> None:
+    _add(db, placed_at.date(), slices, counted="order_count",
+         units=lambda units, amount: units,
+         gmv=lambda units, amount: amount)
+
+
+def record_release(db: Session, order: Order, released_at: datetime) -> None:
+    _add(db, released_at.date(), _order_slices(order),
+         released_amount=lambda units, amount: amount)
+
+
+def record_refund(db: Session, order: Order, refund_amount: float, processed_at: datetime) -> None:
+    # Refunds are order-level; split them across sellers and categories pro rata
+    share = refund_amount / order.total_amount if order.total_amount else 0
+    _add(db, processed_at.date(), _order_slices(order), counted="refund_count",
+         refund_amount=lambda units, amount: amount * share)
+
+
+_UPSERT = """
+ON CONFLICT (day, seller_id, category) DO UPDATE SET
+    order_count = order_count + excluded.order_count,
+    units = units + excluded.units,
+    gmv = gmv + excluded.gmv,
+    released_amount = released_amount + excluded.released_amount,
+    refund_count = refund_count + excluded.refund_count,
+    refund_amount = refund_amount + excluded.refund_amount
+"""
+
+_BACKFILL = [
+    # Sales, on the day the order was placed, counted on the order's first
+    # category like record_sale. Items whose product is gone roll up under ''.
+    # The bare WHERE keeps SQLite from reading ON CONFLICT as a join clause.
+    """
+    WITH slices AS (
+        SELECT o.id AS order_id, date(o.created_at) AS day, oi.seller_id,
+               COALESCE(p.category, '') AS category,
+               SUM(oi.quantity) AS units, SUM(oi.quantity * oi.unit_price) AS amount
+        FROM order_items oi
+        JOIN orders o ON o.id = oi.order_id
+        LEFT JOIN products p ON p.id = oi.product_id
+        WHERE date(o.created_at) >= :since
+        GROUP BY 1, 3, 4
+    )
+    INSERT INTO sales_rollups (day, seller_id, category, order_count, units, gmv,
+                               released_amount, refund_count, refund_amount)
+    SELECT day, seller_id, category,
+           SUM(category = (SELECT MIN(f.category) FROM slices f WHERE f.order_id = s.order_id)),
+           SUM(units), ROUND(SUM(amount), 2), 0, 0, 0
+    FROM slices s
+    WHERE true
+    GROUP BY 1, 2, 3
+    """,
+    # Escrow released to sellers
+    """
+    INSERT INTO sales_rollups (day, seller_id, category, order_count, units, gmv,
+                               released_amount, refund_count, refund_amount)
+    SELECT date(e.released_at), oi.seller_id, COALESCE(p.category, ''),
+           0, 0, 0, ROUND(SUM(oi.quantity * oi.unit_price), 2), 0, 0
+    FROM escrows e
+    JOIN order_items oi ON oi.order_id = e.order_id
+    LEFT JOIN products p ON p.id = oi.product_id
+    WHERE e.status = 'released' AND date(e.released_at) >= :since
+    GROUP BY 1, 2, 3
+    """,
+    # Processed refunds, split pro rata and counted once like record_refund
+    """
+    WITH slices AS (
+        SELECT r.id AS refund_id, date(r.processed_at) AS day, oi.seller_id,
+               COALESCE(p.category, '') AS category,
+               SUM(CASE WHEN o.total_amount > 0
+                        THEN r.amount * oi.quantity * oi.unit_price / o.total_amount ELSE 0 END) AS amount
+        FROM refunds r
+        JOIN orders o ON o.id = r.order_id
+        JOIN order_items oi ON oi.order_id = o.id
+        LEFT JOIN products p ON p.id = oi.product_id
+        WHERE r.status = 'processed' AND date(r.processed_at) >= :since
+        GROUP BY 1, 3, 4
+    )
+    INSERT INTO sales_rollups (day, seller_id, category, order_count, units, gmv,
+                               released_amount, refund_count, refund_amount)
+    SELECT day, seller_id, category, 0, 0, 0, 0,
+           SUM(category = (SELECT MIN(f.category) FROM slices f WHERE f.refund_id = s.refund_id)),
+           ROUND(SUM(amount), 2)
+    FROM slices s
+    WHERE true
+    GROUP BY 1, 2, 3
+    """,
+]
+
+
+def backfill(since: Optional[date] = None) -> int:
+    """Rebuild rollups from ``since`` (or from the beginning) out of the source tables.
+
+    Runs in one transaction, so readers see either the old rows or the rebuilt ones.
+    """
+    with engine.begin() as conn:
+        clear = delete(SalesRollup)
+        if since:
+            clear = clear.where(SalesRollup.day >= since)
+        conn.execute(clear)
+        for sql in _BACKFILL:
+            conn.execute(text(sql + _UPSERT), {"since": since.isoformat() if since else "0001-01-01"})
+        rows = select(func.count()).select_from(SalesRollup)
+        if since:
+            rows = rows.where(SalesRollup.day >= since)
+        return conn.execute(rows).scalar()
@@ -0,0 +1,207 @@
+import asyncio
+import csv
+import logging
+import os
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, cast, literal, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core import jobs
+from app.core.email import send_payout_notification
+from app.core.writer import run_write
+from app.database import SessionLocal
+from app.models.job import Job, JobStatus
+from app.models.payout import Payout, PayoutStatus, SettlementRun, SettlementRunStatus
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+SETTLEMENT_JOB = "settlement"
+
+SETTLEMENT_COLUMNS = [
+    "payout_id", "seller_id", "seller_username", "seller_email",
+    "method", "amount", "reference", "requested_at",
+]
+
+
+def _reference_prefix(run_id: int) -> str:
+    return f"STL{run_id:06d}-"
+
+
+def settlement_reference(run_id: int, payout_id: int) -> str:
+    return f"{_reference_prefix(run_id)}{payout_id}"
+
+
+def settlement_reference_sql(run_id: int):
+    """``settlement_reference`` as a SQL expression over ``Payout.id``, for set-based updates."""
+    return literal(_reference_prefix(run_id)) + cast(Payout.id, String)
+
+
+def start_settlement_runs(method: Optional[str] = None) -> list[int]:
+    """Open one run per payout method with pending payouts and queue its job.
+
+    Payouts are attached to the run as it opens, so payouts requested while
+    the run settles wait for the next one.
+    """
+
+    def unit(w: Session) -> list[int]:
+        methods = (
+            w.query(Payout.method)
+            .filter(Payout.status == PayoutStatus.pending, Payout.settlement_run_id.is_(None))
+            .distinct()
+        )
+        if method:
+            methods = methods.filter(Payout.method == method)
+
+        run_ids = []
+        now = datetime.utcnow()
+        for (payout_method,) in methods.all():
+            run = SettlementRun(method=payout_method, status=SettlementRunStatus.running)
+            w.add(run)
+            w.flush()
+            attached = w.execute(
+                update(Payout)
+                .where(
+                    Payout.status == PayoutStatus.pending,
+                    Payout.method == payout_method,
+                    Payout.settlement_run_id.is_(None),
+                )
+                .values(status=PayoutStatus.processing, processed_at=now, settlement_run_id=run.id)
+                .execution_options(synchronize_session=False)
+            )
+            run.payout_count = attached.rowcount
+            jobs.enqueue(w, SETTLEMENT_JOB, {"run_id": run.id}, ref=str(run.id))
+            run_ids.append(run.id)
+        return run_ids
+
+    with SessionLocal() as db:
+        run_ids = run_write(db, unit)
+    if run_ids:
+        logger.info(f"Opened settlement run(s) {run_ids}")
+    return run_ids
+
+
+def _write_settlement_file(db: Session, run: SettlementRun) -> tuple[str, int, float]:
+    """Stream the run's payouts to a CSV on disk, a batch of rows at a time."""
+    os.makedirs(settings.settlement_dir, exist_ok=True)
+    path = os.path.join(settings.settlement_dir, f"settlement_{run.id:06d}_{run.method}.csv")
+    partial = f"{path}.part"
+
+    rows = (
+        db.query(Payout.id, Payout.seller_id, User.username, User.email, Payout.amount, Payout.created_at)
+        .join(User, User.id == Payout.seller_id)
+        .filter(Payout.settlement_run_id == run.id, Payout.status == PayoutStatus.processing)
+        .order_by(Payout.id)
+        .yield_per(settings.payout_settlement_batch_size)
+    )
+    count, total = 0, 0.0
+    with open(partial, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SETTLEMENT_COLUMNS)
+        for payout_id, seller_id, username, email, amount, created_at in rows:
+            writer.writerow([
+                payout_id, seller_id, username, email, run.method, f"{amount:.2f}",
+                settlement_reference(run.id, payout_id), created_at.isoformat(),
+            ])
+            count += 1
+            total += amount
+    os.replace(partial, path)
+    return path, count, round(total, 2)
+
+
+def settle_run(payload: dict) -> None:
+    """Job handler: write the settlement file, then complete every payout in one transaction."""
+    run_id = payload["run_id"]
+    with SessionLocal() as db:
+        run = db.query(SettlementRun).filter(SettlementRun.id == run_id).first()
+        if not run or run.status != SettlementRunStatus.running:
+            return
+        path, count, total = _write_settlement_file(db, run)
+
+    def unit(w: Session) -> bool:
+        run = w.query(SettlementRun).filter(SettlementRun.id == run_id).first()
+        if run.status != SettlementRunStatus.running:
+            return False
+        now = datetime.utcnow()
+        w.execute(
+            update(Payout)
+            .where(Payout.settlement_run_id == run_id, Payout.status == PayoutStatus.processing)
+            .values(
+                status=PayoutStatus.completed,
+                completed_at=now,
+                reference=settlement_reference_sql(run_id),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        run.status = SettlementRunStatus.completed
+        run.payout_count = count
+        run.total_amount = total
+        run.file_path = path
+        run.completed_at = now
+        return True
+
+    with SessionLocal() as db:
+        if not run_write(db, unit):
+            return
+    logger.info(f"Settlement run #{run_id} completed: {count} payout(s), ${total:.2f}")
+    asyncio.run(_notify_sellers(path))
+
+
+async def _notify_sellers(path: str) -> None:
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            await send_payout_notification(row["seller_email"], float(row["amount"]), "completed")
+
+
+def fail_run(payload: dict, error: str) -> None:
+    """Give-up hook: release the run's payouts back to pending for the next run."""
+    run_id = payload["run_id"]
+
+    def unit(w: Session) -> None:
+        w.execute(
+            update(Payout)
+            .where(Payout.settlement_run_id == run_id, Payout.status == PayoutStatus.processing)
+            .values(status=PayoutStatus.pending, processed_at=None, settlement_run_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        run = w.query(SettlementRun).filter(SettlementRun.id == run_id).first()
+        if run:
+            run.status = SettlementRunStatus.failed
+            run.error = error
+            run.completed_at = datetime.utcnow()
+
+    with SessionLocal() as db:
+        run_write(db, unit)
+    logger.error(f"Settlement run #{run_id} failed, payouts returned to pending: {error}")
+
+
+def recover_stuck_runs() -> int:
+    """Re-queue running settlement runs whose job is gone, e.g. one failed for want of a handler.
+
+    ``settle_run`` is idempotent, so a run is simply settled again.
+    """
+    with SessionLocal() as db:
+        live = {
+            ref
+            for (ref,) in db.query(Job.ref).filter(
+                Job.kind == SETTLEMENT_JOB,
+                Job.status.in_([JobStatus.queued, JobStatus.running]),
+            )
+        }
+        stuck = [
+            run_id
+            for (run_id,) in db.query(SettlementRun.id).filter(SettlementRun.status == SettlementRunStatus.running)
+            if str(run_id) not in live
+        ]
+        for run_id in stuck:
+            jobs.enqueue(db, SETTLEMENT_JOB, {"run_id": run_id}, ref=str(run_id))
+        db.commit()
+    if stuck:
+        logger.warning(f"Re-queued {len(stuck)} settlement run(s) left without a job")
+    return len(stuck)
+
+
+jobs.register_handler(SETTLEMENT_JOB, settle_run, give_up=fail_run)
@@ -0,0 +1,28 @@
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.database import read_engine, writer_engine
+from app.models.counter import COUNTER_QUERIES, PlatformCounter, apply_drift, measure_drift
+
+logger = logging.getLogger(__name__)
+
+
+def get_platform_stats(db: Session) -> dict[str, int]:
+    values = dict(db.query(PlatformCounter.name, PlatformCounter.value).all())
+    return {name: values.get(name, 0) for name in COUNTER_QUERIES}
+
+
+def recount_counters() -> None:
+    """Correct any drift, e.g. from rows changed with triggers disabled or by hand.
+
+    Counting happens on a read connection; only the counters that are off are
+    then adjusted in a short write transaction.
+    """
+    with read_engine.connect() as conn:
+        drift = measure_drift(conn)
+    if not drift:
+        return
+    with writer_engine.begin() as conn:
+        apply_drift(conn, drift)
+    logger.warning(f"Platform counters drifted, corrected by {drift}")
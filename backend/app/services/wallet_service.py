@@ -137,3 +137,21 @@ def admin_adjust_balance(db: Session, user_id: int, amount: float, description:
     )
     db.add(txn)
     return txn
+
+
+def reverse_payout_deduction(db: Session, seller_id: int, amount: float, payout_id: int) -> WalletTransaction:
+    wallet = get_or_create_wallet(db, seller_id)
+    wallet.pending_balance = round(wallet.pending_balance + amount, 2)
+
+    txn = WalletTransaction(
+        wallet_id=wallet.id,
+        user_id=seller_id,
+        amount=amount,
+        transaction_type=TransactionType.payout,
+        reference_id=payout_id,
+        reference_type="payout",
+        description=f"Payout #{payout_id} failed, funds returned",
+        balance_after=wallet.balance,
+    )
+    db.add(txn)
+    return txn
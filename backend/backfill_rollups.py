@@ -0,0 +1,31 @@
+"""
+Rebuild the sales_rollups table from orders, escrows and refunds.
+Run once after upgrading, or to repair a date range after manual data fixes.
+
+Usage: python backfill_rollups.py [--since YYYY-MM-DD]
+"""
+
+import argparse
+import logging
+import time
+from datetime import date
+
+from app.database import init_db
+from app.services.rollup_service import backfill
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--since", type=date.fromisoformat, help="first day to rebuild (default: everything)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    init_db()
+    rows = backfill(args.since)
+    logger.info(
+        f"Rebuilt {rows} rollup row(s) since {args.since or 'the beginning'} "
+        f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+    )
@@ -6,27 +6,51 @@ Safe to run multiple times — skips if already seeded.
 
 import logging
 import sys
+import time
 from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash
-from app.database import SessionLocal, init_db
+from app.database import SessionLocal, engine, get_meta, init_db, set_meta
 from app.models.audit import AuditLog
 from app.models.escrow import Escrow, EscrowStatus
 from app.models.order import Order, OrderItem, OrderStatus
 from app.models.product import Product, ProductType
 from app.models.user import User, UserRole
 from app.models.wallet import TransactionType, Wallet, WalletTransaction
+from app.services.rollup_service import backfill
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
 
 def is_seeded(db: Session) -> bool:
+    if get_meta(db.connection(), "seeded") == "1":
+        return True
     return db.query(User).filter(User.email == "admin@mercury.com").first() is not None
 
 
+def mark_seeded() -> None:
+    with engine.begin() as conn:
+        set_meta(conn, "seeded", "1")
+
+
+# Bump to rebuild existing rollups once after a change in how they are booked
+ROLLUPS_VERSION = "2"
+
+
+def ensure_rollups() -> None:
+    """Build sales rollups once for data that predates them, including the demo orders."""
+    with engine.connect() as conn:
+        if get_meta(conn, "rollups_backfilled") == ROLLUPS_VERSION:
+            return
+    rows = backfill()
+    with engine.begin() as conn:
+        set_meta(conn, "rollups_backfilled", ROLLUPS_VERSION)
+    logger.info(f"Backfilled {rows} sales rollup row(s)")
+
+
 def seed(db: Session) -> None:
     logger.info("Seeding database with demo data...")
 
@@ -330,6 +354,7 @@ def seed(db: Session) -> None:
 
 
 if __name__ == "__main__":
+    started = time.perf_counter()
     init_db()
     db = SessionLocal()
     try:
@@ -337,9 +362,12 @@ if __name__ == "__main__":
             logger.info("Database already seeded — skipping.")
         else:
             seed(db)
+        mark_seeded()
+        ensure_rollups()
     except Exception as e:
         logger.error(f"Seeding failed: {e}")
         db.rollback()
         sys.exit(1)
     finally:
         db.close()
+    logger.info(f"Seed check finished in {(time.perf_counter() - started) * 1000:.0f} ms")
@@ -0,0 +1,48 @@
+"""
+Standalone job worker for Mercury Marketplace.
+Drains the durable job queue (payouts, settlement runs, …) outside the web workers, so job
+throughput can be scaled without adding HTTP processes. Run the web workers
+with JOB_WORKER_CONCURRENCY=0 to leave all jobs to this process.
+
+Usage: python worker.py [concurrency]
+"""
+
+import logging
+import signal
+import sys
+import threading
+
+from app.config import settings
+from app.core import jobs
+from app.core.tasks import leader
+from app.core.writer import shutdown_writer
+from app.database import init_db
+from app.services import payout_service, settlement_service
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else max(1, settings.job_worker_concurrency)
+    init_db()
+    if leader.acquire():
+        payout_service.recover_stuck_payouts()
+        settlement_service.recover_stuck_runs()
+        leader.release()
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    signal.signal(signal.SIGINT, lambda *_: stopping.set())
+
+    pool = jobs.JobWorker(concurrency, settings.job_poll_interval)
+    pool.start()
+    logger.info(f"Job worker running with {concurrency} thread(s)")
+    stopping.wait()
+
+    logger.info("Stopping job worker")
+    pool.stop(timeout=settings.job_visibility_timeout)
+    shutdown_writer()
@@ -9,20 +9,13 @@ echo "════════════════════════
 mkdir -p /data
 chown -R "$(id -u):$(id -g)" /data 2>/dev/null || true
 
-# Initialise database tables
-echo "→ Initializing database schema…"
-python -c "
-from app.database import init_db
-init_db()
-print('  Schema ready.')
-"
-
-# Seed demo data (safe to run multiple times)
-echo "→ Checking seed data…"
+# Bring the schema up to date and seed demo data. Both are no-ops when the
+# database is already current, so restarts skip straight to uvicorn.
+echo "→ Preparing database…"
 python seed.py
 
 echo ""
-echo "→ Starting API server on http://0.0.0.0:8005"
+echo "→ Starting API server on http://0.0.0.0:8005 (${WEB_CONCURRENCY:-1} worker(s))"
 echo "  API docs: http://localhost:8005/api/docs"
 echo "  App:      http://localhost:8005"
 echo "═══════════════════════════════════════════════════"
@@ -30,7 +23,7 @@ echo "════════════════════════
 exec uvicorn app.main:app \
     --host 0.0.0.0 \
     --port 8005 \
-    --workers 1 \
+    --workers "${WEB_CONCURRENCY:-1}" \
     --log-level info \
     --proxy-headers \
     --forwarded-allow-ips '*'
@@ -132,6 +132,27 @@ class ApiClient {
   delete<T>(path: string): Promise<T> {
     return this.request<T>(path, { method: "DELETE" });
   }
+
+  /** Swap an expired access token for a new one; false means the session is over. */
+  refreshSession(): Promise<boolean> {
+    return this.tryRefresh();
+  }
+
+  /**
+   * Open a socket and authenticate in its first frame, so the token never
+   * appears in the URL or in access logs.
+   */
+  socket(path: string, params: Record<string, string> = {}): WebSocket {
+    const query = new URLSearchParams(params);
+    const scheme = window.location.protocol === "https:" ? "wss" : "ws";
+    const socket = new WebSocket(`${scheme}://${window.location.host}${BASE_URL}${path}?${query}`);
+    socket.addEventListener("open", () => this.authenticateSocket(socket));
+    return socket;
+  }
+
+  authenticateSocket(socket: WebSocket): void {
+    socket.send(JSON.stringify({ type: "auth", token: this.accessToken ?? "" }));
+  }
 }
 
 export const api = new ApiClient();
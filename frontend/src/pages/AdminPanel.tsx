@@ -1,6 +1,6 @@
 import { useEffect, useState } from "react";
 import { api } from "../api/client";
-import type { Dispute, Order, User } from "../types";
+import type { AdminUser, BulkUserActionResult, CursorPage, DisputeSummary, Order } from "../types";
 
 type AdminTab = "overview" | "users" | "orders" | "disputes";
 
@@ -14,13 +14,16 @@ interface Stats {
 export function AdminPanel() {
   const [tab, setTab] = useState<AdminTab>("overview");
   const [stats, setStats] = useState<Stats | null>(null);
-  const [users, setUsers] = useState<User[]>([]);
+  const [users, setUsers] = useState<AdminUser[]>([]);
+  const [usersCursor, setUsersCursor] = useState<string | null>(null);
+  const [selectedUsers, setSelectedUsers] = useState<Set<number>>(new Set());
   const [orders, setOrders] = useState<Order[]>([]);
-  const [disputes, setDisputes] = useState<Dispute[]>([]);
+  const [disputes, setDisputes] = useState<DisputeSummary[]>([]);
+  const [disputesCursor, setDisputesCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [searchUser, setSearchUser] = useState("");
   const [actionMsg, setActionMsg] = useState("");
-  const [selectedDispute, setSelectedDispute] = useState<Dispute | null>(null);
+  const [selectedDispute, setSelectedDispute] = useState<DisputeSummary | null>(null);
   const [resolution, setResolution] = useState("");
   const [refundBuyer, setRefundBuyer] = useState(true);
   const [resolveLoading, setResolveLoading] = useState(false);
@@ -32,8 +35,7 @@ export function AdminPanel() {
   useEffect(() => {
     if (tab === "users") {
       setLoading(true);
-      const q = searchUser ? `?search=${encodeURIComponent(searchUser)}` : "";
-      api.get<User[]>(`/admin/users${q}`).then(setUsers).finally(() => setLoading(false));
+      loadUsers().finally(() => setLoading(false));
     }
     if (tab === "orders") {
       setLoading(true);
@@ -41,11 +43,29 @@ export function AdminPanel() {
     }
     if (tab === "disputes") {
       setLoading(true);
-      api.get<Dispute[]>("/admin/disputes").then(setDisputes).finally(() => setLoading(false));
+      loadDisputes().finally(() => setLoading(false));
     }
   }, [tab, searchUser]);
 
-  const handleFreezeToggle = async (user: User) => {
+  const loadUsers = async (cursor?: string) => {
+    const params = new URLSearchParams();
+    if (searchUser) params.set("search", searchUser);
+    if (cursor) params.set("cursor", cursor);
+    const q = params.toString() ? `?${params}` : "";
+    const page = await api.get<CursorPage<AdminUser>>(`/admin/users${q}`);
+    setUsers((prev) => (cursor ? [...prev, ...page.items] : page.items));
+    setUsersCursor(page.next_cursor);
+    if (!cursor) setSelectedUsers(new Set());
+  };
+
+  const loadDisputes = async (cursor?: string) => {
+    const q = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+    const page = await api.get<CursorPage<DisputeSummary>>(`/admin/disputes${q}`);
+    setDisputes((prev) => (cursor ? [...prev, ...page.items] : page.items));
+    setDisputesCursor(page.next_cursor);
+  };
+
+  const handleFreezeToggle = async (user: AdminUser) => {
     const endpoint = user.is_frozen ? `/admin/users/${user.id}/unfreeze` : `/admin/users/${user.id}/freeze`;
     await api.put(endpoint);
     setActionMsg(`Account @${user.username} ${user.is_frozen ? "unfrozen" : "frozen"}`);
@@ -57,6 +77,28 @@ export function AdminPanel() {
     setUsers((prev) => prev.map((u) => u.id === userId ? { ...u, is_verified: true } : u));
   };
 
+  const toggleSelected = (userId: number) => {
+    setSelectedUsers((prev) => {
+      const next = new Set(prev);
+      if (next.has(userId)) next.delete(userId);
+      else next.add(userId);
+      return next;
+    });
+  };
+
+  const handleBulkAction = async (action: "freeze" | "unfreeze" | "verify") => {
+    const result = await api.post<BulkUserActionResult>("/admin/users/bulk", {
+      action,
+      user_ids: [...selectedUsers],
+    });
+    const updated = new Set(result.results.filter((r) => r.outcome === "updated").map((r) => r.user_id));
+    const patch: Partial<AdminUser> =
+      action === "verify" ? { is_verified: true } : { is_frozen: action === "freeze" };
+    setUsers((prev) => prev.map((u) => (updated.has(u.id) ? { ...u, ...patch } : u)));
+    setSelectedUsers(new Set());
+    setActionMsg(`${action}: ${result.updated} of ${result.requested} account(s) updated`);
+  };
+
   const handleResolveDispute = async () => {
     if (!selectedDispute || !resolution) return;
     setResolveLoading(true);
@@ -67,8 +109,7 @@ export function AdminPanel() {
       });
       setSelectedDispute(null);
       setResolution("");
-      const updated = await api.get<Dispute[]>("/admin/disputes");
-      setDisputes(updated);
+      await loadDisputes();
     } catch (err) {
       alert(err instanceof Error ? err.message : "Failed to resolve dispute");
     } finally {
@@ -112,10 +153,18 @@ export function AdminPanel() {
             <input
               type="search"
               className="form-input"
-              placeholder="Search by email or username…"
+              placeholder="Email, username or name starts with…"
               value={searchUser}
               onChange={(e) => setSearchUser(e.target.value)}
             />
+            {selectedUsers.size > 0 && (
+              <div className="admin-actions">
+                <span className="text-muted">{selectedUsers.size} selected</span>
+                <button className="btn btn-xs btn-danger" onClick={() => handleBulkAction("freeze")}>Freeze</button>
+                <button className="btn btn-xs btn-success" onClick={() => handleBulkAction("unfreeze")}>Unfreeze</button>
+                <button className="btn btn-xs btn-secondary" onClick={() => handleBulkAction("verify")}>Verify</button>
+              </div>
+            )}
           </div>
           {loading ? (
             <div className="loading-state">Loading users…</div>
@@ -124,16 +173,20 @@ export function AdminPanel() {
               <table className="admin-table">
                 <thead>
                   <tr>
-                    <th>ID</th><th>Username</th><th>Email</th><th>Role</th><th>Verified</th><th>Status</th><th>Actions</th>
+                    <th></th><th>ID</th><th>Username</th><th>Email</th><th>Role</th><th>Wallet</th><th>Verified</th><th>Status</th><th>Actions</th>
                   </tr>
                 </thead>
                 <tbody>
                   {users.map((u) => (
                     <tr key={u.id} className={u.is_frozen ? "row-frozen" : ""}>
+                      <td>
+                        <input type="checkbox" checked={selectedUsers.has(u.id)} onChange={() => toggleSelected(u.id)} />
+                      </td>
                       <td>{u.id}</td>
                       <td>@{u.username}</td>
                       <td>{u.email}</td>
                       <td><span className={`role-badge role-${u.role}`}>{u.role}</span></td>
+                      <td>${u.wallet_balance.toFixed(2)}{u.wallet_pending > 0 && <span className="text-muted"> (+${u.wallet_pending.toFixed(2)})</span>}</td>
                       <td>{u.is_verified ? "✓" : "✗"}</td>
                       <td>{u.is_frozen ? <span className="text-danger">Frozen</span> : <span className="text-success">Active</span>}</td>
                       <td className="admin-actions">
@@ -153,6 +206,11 @@ export function AdminPanel() {
                   ))}
                 </tbody>
               </table>
+              {usersCursor && (
+                <button className="btn btn-sm btn-secondary" onClick={() => loadUsers(usersCursor)}>
+                  Load more
+                </button>
+              )}
             </div>
           )}
         </div>
@@ -193,7 +251,7 @@ export function AdminPanel() {
                   <div key={d.id} className={`dispute-admin-row ${["open", "under_review"].includes(d.status) ? "dispute-open" : ""}`}>
                     <div className="dispute-admin-info">
                       <strong>Dispute #{d.id}</strong> — Order #{d.order_id}
-                      <span className="text-muted">Buyer: @{d.buyer_username} / Seller: @{d.seller_username}</span>
+                      <span className="text-muted">Buyer: @{d.buyer_username} / Seller: @{d.seller_username} · {d.message_count} message{d.message_count !== 1 ? "s" : ""}</span>
                       <p>{d.reason.slice(0, 150)}…</p>
                     </div>
                     <div className="dispute-admin-actions">
@@ -206,6 +264,11 @@ export function AdminPanel() {
                     </div>
                   </div>
                 ))}
+                {disputesCursor && (
+                  <button className="btn btn-sm btn-secondary" onClick={() => loadDisputes(disputesCursor)}>
+                    Load more
+                  </button>
+                )}
               </div>
 
               {selectedDispute && (
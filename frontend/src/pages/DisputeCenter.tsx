@@ -1,7 +1,7 @@
 import { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
 import { api } from "../api/client";
-import type { Dispute, DisputeStatus } from "../types";
+import type { CursorPage, DisputeStatus, DisputeSummary } from "../types";
 
 const STATUS_LABELS: Record<DisputeStatus, string> = {
   open: "Open",
@@ -20,15 +20,32 @@ const STATUS_CLASS: Record<DisputeStatus, string> = {
 };
 
 export function DisputeCenter() {
-  const [disputes, setDisputes] = useState<Dispute[]>([]);
+  const [disputes, setDisputes] = useState<DisputeSummary[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
-    api.get<Dispute[]>("/disputes")
-      .then(setDisputes)
+    api.get<CursorPage<DisputeSummary>>("/disputes")
+      .then((page) => {
+        setDisputes(page.items);
+        setNextCursor(page.next_cursor);
+      })
       .finally(() => setLoading(false));
   }, []);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const page = await api.get<CursorPage<DisputeSummary>>(`/disputes?cursor=${encodeURIComponent(nextCursor)}`);
+      setDisputes((prev) => [...prev, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   return (
     <div className="page">
       <h1 className="page-title">Dispute Center</h1>
@@ -62,10 +79,15 @@ export function DisputeCenter() {
                 <span>Buyer: @{d.buyer_username}</span>
                 <span>Seller: @{d.seller_username}</span>
                 <span>{new Date(d.created_at).toLocaleDateString()}</span>
-                <span>{d.messages.length} message{d.messages.length !== 1 ? "s" : ""}</span>
+                <span>{d.message_count} message{d.message_count !== 1 ? "s" : ""}</span>
               </div>
             </Link>
           ))}
+          {nextCursor && (
+            <button className="btn btn-secondary" onClick={loadMore} disabled={loadingMore}>
+              {loadingMore ? "Loading…" : "Load more"}
+            </button>
+          )}
         </div>
       )}
     </div>
@@ -21,6 +21,10 @@ export function DisputeDetail() {
   const [sendLoading, setSendLoading] = useState(false);
   const [error, setError] = useState("");
   const messagesEndRef = useRef<HTMLDivElement>(null);
+  const socketRef = useRef<WebSocket | null>(null);
+  // Last message sent over the socket, resent if the token had expired
+  const pendingRef = useRef<string | null>(null);
+  const [socketEpoch, setSocketEpoch] = useState(0);
 
   const refresh = () => api.get<Dispute>(`/disputes/${id}`).then(setDispute);
 
@@ -29,6 +33,59 @@ export function DisputeDetail() {
     refresh().finally(() => setLoading(false));
   }, [id]);
 
+  // Once the thread is loaded, new messages and status changes arrive as deltas.
+  useEffect(() => {
+    if (loading || !dispute) return;
+    const lastId = dispute.messages.length ? dispute.messages[dispute.messages.length - 1].id : 0;
+    const socket = api.socket(`/disputes/${id}/ws`, { after: String(lastId) });
+    socket.onmessage = (event) => {
+      const data = JSON.parse(event.data);
+      if (data.type === "message") {
+        const msg: DisputeMessage = data.message;
+        if (msg.sender_id === user?.id && msg.content === pendingRef.current) pendingRef.current = null;
+        setDispute((prev) => prev && !prev.messages.some((m) => m.id === msg.id)
+          ? { ...prev, messages: [...prev.messages, msg] }
+          : prev);
+      } else if (data.type === "status") {
+        refresh();
+      } else if (data.type === "error" && data.status === 401) {
+        recoverSession(socket);
+      } else if (data.type === "error") {
+        pendingRef.current = null;
+        setError(data.detail);
+      }
+    };
+    socketRef.current = socket;
+    return () => {
+      socketRef.current = null;
+      socket.close();
+    };
+  }, [id, loading, socketEpoch]);
+
+  // The access token expired: refresh it, post anything unsent over HTTP and
+  // re-authenticate the socket, or reopen it if the server closed it.
+  const recoverSession = async (socket: WebSocket) => {
+    if (!(await api.refreshSession())) {
+      setError("Session expired. Please log in again.");
+      return;
+    }
+    const pending = pendingRef.current;
+    pendingRef.current = null;
+    if (pending) {
+      try {
+        await api.post<DisputeMessage>(`/disputes/${id}/messages`, { content: pending });
+        refresh();
+      } catch (err) {
+        setError(err instanceof Error ? err.message : "Failed to send message");
+      }
+    }
+    if (socket.readyState === WebSocket.OPEN) {
+      api.authenticateSocket(socket);
+    } else if (socketRef.current === socket) {
+      setSocketEpoch((epoch) => epoch + 1);
+    }
+  };
+
   useEffect(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
   }, [dispute?.messages]);
@@ -39,9 +96,15 @@ export function DisputeDetail() {
     setSendLoading(true);
     setError("");
     try {
-      await api.post<DisputeMessage>(`/disputes/${id}/messages`, { content: message });
+      const socket = socketRef.current;
+      if (socket && socket.readyState === WebSocket.OPEN) {
+        pendingRef.current = message;
+        socket.send(JSON.stringify({ content: message }));
+      } else {
+        await api.post<DisputeMessage>(`/disputes/${id}/messages`, { content: message });
+        refresh();
+      }
       setMessage("");
-      refresh();
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to send message");
     } finally {
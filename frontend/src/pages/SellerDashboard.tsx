@@ -2,29 +2,36 @@ import { useEffect, useState } from "react";
 import { Link, useNavigate } from "react-router-dom";
 import { api } from "../api/client";
 import { useAuth } from "../contexts/AuthContext";
-import type { Order, Payout, Product, Wallet } from "../types";
+import type { Order, Payout, Product, SellerDashboardSummary } from "../types";
 
-function SellerStats({ orders, wallet }: { orders: Order[]; wallet: Wallet | null }) {
-  const completed = orders.filter((o) => o.status === "completed").length;
-  const pending = orders.filter((o) => ["paid", "shipped"].includes(o.status)).length;
-  const revenue = orders.filter((o) => o.status === "completed").reduce((s, o) => s + o.total_amount, 0);
+function SellerStats({ summary }: { summary: SellerDashboardSummary }) {
+  const count = (status: keyof SellerDashboardSummary["orders"]) => summary.orders[status]?.count ?? 0;
+  const recentGmv = summary.recent_sales.reduce((s, d) => s + d.gmv, 0);
 
   return (
     <div className="stats-grid">
       <div className="stat-card">
-        <span className="stat-value">{orders.length}</span>
+        <span className="stat-value">{summary.total_orders}</span>
         <span className="stat-label">Total Orders</span>
       </div>
       <div className="stat-card">
-        <span className="stat-value">{pending}</span>
+        <span className="stat-value">{count("paid") + count("shipped")}</span>
         <span className="stat-label">Pending Fulfillment</span>
       </div>
       <div className="stat-card">
-        <span className="stat-value">{completed}</span>
+        <span className="stat-value">{count("completed")}</span>
         <span className="stat-label">Completed</span>
       </div>
+      <div className="stat-card">
+        <span className="stat-value">{summary.active_products}</span>
+        <span className="stat-label">Active Products</span>
+      </div>
+      <div className="stat-card stat-card-money">
+        <span className="stat-value">${recentGmv.toFixed(2)}</span>
+        <span className="stat-label">Sales (30 days)</span>
+      </div>
       <div className="stat-card stat-card-money">
-        <span className="stat-value">${wallet?.pending_balance.toFixed(2) ?? "0.00"}</span>
+        <span className="stat-value">${summary.pending_balance.toFixed(2)}</span>
         <span className="stat-label">Pending Earnings</span>
       </div>
     </div>
@@ -37,7 +44,7 @@ export function SellerDashboard() {
   const [orders, setOrders] = useState<Order[]>([]);
   const [products, setProducts] = useState<Product[]>([]);
   const [payouts, setPayouts] = useState<Payout[]>([]);
-  const [wallet, setWallet] = useState<Wallet | null>(null);
+  const [summary, setSummary] = useState<SellerDashboardSummary | null>(null);
   const [loading, setLoading] = useState(true);
   const [tab, setTab] = useState<"orders" | "products" | "payouts">("orders");
   const [payoutAmount, setPayoutAmount] = useState("");
@@ -46,15 +53,15 @@ export function SellerDashboard() {
   const [payoutError, setPayoutError] = useState("");
 
   const fetchAll = async () => {
-    const [o, p, w, pays] = await Promise.all([
+    const [sum, o, p, pays] = await Promise.all([
+      api.get<SellerDashboardSummary>("/seller/dashboard"),
       api.get<Order[]>("/orders/seller"),
-      api.get<{ items: Product[] }>("/products?per_page=100"),
-      api.get<Wallet>("/wallet"),
+      api.get<{ items: Product[] }>(`/products?seller_id=${user?.id}&per_page=100`),
       api.get<{ items: Payout[] }>("/payouts"),
     ]);
+    setSummary(sum);
     setOrders(o);
-    setProducts(p.items.filter((pr) => pr.seller_id === user?.id));
-    setWallet(w);
+    setProducts(p.items);
     setPayouts(pays.items);
   };
 
@@ -88,7 +95,7 @@ export function SellerDashboard() {
     }
   };
 
-  const pendingOrders = orders.filter((o) => o.status === "paid");
+  const awaitingShipment = summary?.orders.paid?.count ?? 0;
 
   return (
     <div className="page">
@@ -99,15 +106,15 @@ export function SellerDashboard() {
         </button>
       </div>
 
-      {loading ? (
+      {loading || !summary ? (
         <div className="loading-state">Loading…</div>
       ) : (
         <>
-          <SellerStats orders={orders} wallet={wallet} />
+          <SellerStats summary={summary} />
 
-          {pendingOrders.length > 0 && (
+          {awaitingShipment > 0 && (
             <div className="alert alert-info" style={{ marginBottom: "24px" }}>
-              You have {pendingOrders.length} order{pendingOrders.length > 1 ? "s" : ""} awaiting shipment.
+              You have {awaitingShipment} order{awaitingShipment > 1 ? "s" : ""} awaiting shipment.
             </div>
           )}
 
@@ -163,7 +170,7 @@ export function SellerDashboard() {
             <div className="payouts-section">
               <div className="payout-request-card">
                 <h3>Request Payout</h3>
-                <p className="text-muted">Available: <strong>${wallet?.pending_balance.toFixed(2)}</strong></p>
+                <p className="text-muted">Available: <strong>${summary.pending_balance.toFixed(2)}</strong></p>
                 <form onSubmit={handleRequestPayout} className="payout-form">
                   <div className="form-row">
                     <input
@@ -174,7 +181,7 @@ export function SellerDashboard() {
                       onChange={(e) => setPayoutAmount(e.target.value)}
                       min="1"
                       step="0.01"
-                      max={wallet?.pending_balance}
+                      max={summary.pending_balance}
                     />
                     <button type="submit" className="btn btn-primary" disabled={payoutLoading}>
                       {payoutLoading ? "Processing…" : "Request Payout"}
@@ -50,7 +50,8 @@ export function SellerDrive() {
             });
 
             if (!res.ok) {
-                throw new Error("Failed to upload file");
+                const body = await res.json().catch(() => null);
+                throw new Error(body?.detail || "Failed to upload file");
             }
 
             await fetchFiles();
@@ -119,7 +120,7 @@ export function SellerDrive() {
                         <tbody>
                             {files.map((file) => (
                                 <tr key={file.id} style={{ borderBottom: "1px solid #eee" }}>
-                                    <td style={{ padding: "10px" }}>{file.file_name}</td>
+                                    <td style={{ padding: "10px" }} title={file.checksum ? `SHA-256 ${file.checksum}` : undefined}>{file.file_name}</td>
                                     <td style={{ padding: "10px" }}>{(file.size / 1024).toFixed(2)} KB</td>
                                     <td style={{ padding: "10px" }}>{new Date(file.created_at).toLocaleString()}</td>
                                     <td style={{ padding: "10px", textAlign: "right", gap: "10px", display: "flex", justifyContent: "flex-end" }}>
@@ -14,6 +14,20 @@ export interface User {
   created_at: string;
 }
 
+export interface AdminUser extends User {
+  wallet_balance: number;
+  wallet_pending: number;
+}
+
+export type BulkUserAction = "freeze" | "unfreeze" | "verify" | "wallet_adjust";
+
+export interface BulkUserActionResult {
+  action: BulkUserAction;
+  requested: number;
+  updated: number;
+  results: { user_id: number; outcome: "updated" | "unchanged" | "not_found" | "rejected"; detail: string | null }[];
+}
+
 export type ProductType = "digital" | "shippable";
 
 export interface Product {
@@ -134,6 +148,16 @@ export interface Dispute {
   messages: DisputeMessage[];
 }
 
+export interface DisputeSummary extends Omit<Dispute, "messages"> {
+  message_count: number;
+  last_message: DisputeMessage | null;
+}
+
+export interface CursorPage<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
 export type PayoutStatus = "pending" | "processing" | "completed" | "failed";
 
 export interface Payout {
@@ -149,6 +173,29 @@ export interface Payout {
   completed_at: string | null;
 }
 
+export interface StatusTotal {
+  count: number;
+  amount: number;
+}
+
+export interface DailySales {
+  day: string;
+  order_count: number;
+  units: number;
+  gmv: number;
+}
+
+export interface SellerDashboardSummary {
+  balance: number;
+  pending_balance: number;
+  total_orders: number;
+  orders: Partial<Record<OrderStatus, StatusTotal>>;
+  payouts: Partial<Record<PayoutStatus, StatusTotal>>;
+  active_products: number;
+  inactive_products: number;
+  recent_sales: DailySales[];
+}
+
 export interface CartItem {
   product: Product;
   quantity: number;
@@ -164,5 +211,6 @@ export interface DriveFile {
   file_name: string;
   content_type: string | null;
   size: number;
+  checksum: string | null;
   created_at: string;
 }
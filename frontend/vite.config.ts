@@ -8,6 +8,7 @@ export default defineConfig({
       "/api": {
         target: "http://localhost:8005",
         changeOrigin: true,
+        ws: true,
       },
     },
   },